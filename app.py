@@ -5,18 +5,75 @@ Provides a web interface for monitoring and controlling the game bot
 
 import json
 import logging
-from flask import Flask, render_template, request, jsonify, Response
-from datetime import datetime
-import base64
-import io
+import math
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
+import itertools
+import time
+import hashlib
+import threading
+import cv2
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# libjpeg-turbo's SIMD encoder; needs the native library as well as the wrapper
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    turbo_jpeg = TurboJPEG()
+except Exception:
+    turbo_jpeg = None
+
+# Background capture rate, and how long it keeps capturing after the last viewer
+CAPTURE_FPS = 10
+CAPTURE_IDLE_TIMEOUT = 5.0
+
+# A captured frame older than this is not served (capture stalled or idle)
+FRAME_MAX_AGE = 5.0 / CAPTURE_FPS
+
+# Each MJPEG viewer holds a server thread for as long as it is connected,
+# so only this many streams run at once; others poll /api/screen.jpg
+MAX_STREAM_VIEWERS = 2
+
+def dumps_bytes(data):
+    """Serialize data to JSON bytes with orjson when available"""
+    if not ORJSON_AVAILABLE:
+        return json.dumps(data).encode('utf-8')
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+def fast_jsonify(data, status=200):
+    """Serialize a response with orjson, falling back to Flask's jsonify"""
+    if not ORJSON_AVAILABLE:
+        return jsonify(data), status
+    return Response(dumps_bytes(data), status=status, mimetype='application/json')
+
+def etag_jsonify(data):
+    """JSON response with a content ETag; answers 304 when the client already has it"""
+    payload = dumps_bytes(data)
+    etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if request.headers.get('If-None-Match') == etag:
+        return Response(status=304, headers=headers)
+    return Response(payload, mimetype='application/json', headers=headers)
 
 def create_app(game_bot):
     """Create Flask application with game bot instance"""
     app = Flask(__name__)
     app.config['SECRET_KEY'] = 'game_bot_secret_key_2024'
     
-    # Store bot reference in app config to avoid type issues
-    app.config['GAME_BOT'] = game_bot
+    # Bind the bot's subsystems once so views don't walk app.config per request
+    vision = game_bot.vision_system
+    automation = game_bot.automation_engine
+    learning = game_bot.learning_system
+    knowledge_manager = game_bot.knowledge_manager
+    macro_system = game_bot.macro_system
+    command_processor = game_bot.command_processor
+    trainer = game_bot.interactive_trainer
+    
+    frame_counter = itertools.count(1)
     
     @app.route('/')
     def index():
@@ -27,46 +84,177 @@ def create_app(game_bot):
     def get_status():
         """Get current bot status"""
         try:
-            # Get screen capture
-            game_bot = app.config['GAME_BOT']
-            screen_data = game_bot.vision_system.capture_screen()
-            screen_b64 = None
-            
-            if screen_data is not None:
-                # Convert to base64 for web display
-                import cv2
-                import numpy as np
-                
-                # Resize for web display
-                height, width = screen_data.shape[:2]
-                if width > 800:
-                    scale = 800 / width
-                    new_width = 800
-                    new_height = int(height * scale)
-                    screen_data = cv2.resize(screen_data, (new_width, new_height))
-                
-                # Convert to base64
-                _, buffer = cv2.imencode('.jpg', screen_data)
-                screen_b64 = base64.b64encode(buffer).decode('utf-8')
+            # The screen itself is served by /api/screen.jpg; the frame id
+            # busts the browser cache so each poll loads a fresh image
+            frame_id = next(frame_counter)
             
             # Get system status
             status = {
-                'timestamp': datetime.now().isoformat(),
-                'vision_active': game_bot.vision_system.is_active(),
-                'automation_active': game_bot.automation_engine.is_active(),
-                'learning_stats': game_bot.learning_system.get_stats(),
-                'knowledge_count': game_bot.knowledge_manager.get_knowledge_count(),
-                'macro_count': len(game_bot.macro_system.list_macros()),
-                'screen_capture': screen_b64,
-                'last_command': getattr(game_bot.command_processor, 'last_command', 'None'),
-                'last_result': getattr(game_bot.command_processor, 'last_result', 'None')
+                'timestamp': time.time(),
+                'vision_active': vision.is_active(),
+                'automation_active': automation.is_active(),
+                'learning_stats': learning.get_stats(),
+                'knowledge_count': knowledge_manager.get_knowledge_count(),
+                'macro_count': len(macro_system.list_macros()),
+                'frame_id': frame_id,
+                'screen_url': f'/api/screen.jpg?frame={frame_id}',
+                'last_command': getattr(command_processor, 'last_command', 'None'),
+                'last_result': getattr(command_processor, 'last_result', 'None')
             }
             
-            return jsonify(status)
+            return fast_jsonify(status)
         except Exception as e:
             app.logger.error(f"Error getting status: {e}")
+            return fast_jsonify({'error': str(e)}, 500)
+    
+    def encode_screen():
+        """Capture the screen and return (jpeg_bytes, frame_hash), or (None, None) if unavailable"""
+        screen_data = vision.capture_screen()
+        
+        if screen_data is None:
+            with screen_lock:
+                app.config['LAST_FRAME_JPEG'] = None
+                app.config['LAST_FRAME_HASH'] = None
+            return None, None
+        
+        # Hash a strided sample of the frame; an unchanged screen reuses the
+        # previous JPEG instead of resizing and encoding again
+        sample = np.ascontiguousarray(screen_data[::4, ::4])
+        frame_hash = hashlib.blake2b(sample.data, digest_size=8).hexdigest()
+        with screen_lock:
+            last_jpeg, last_hash = app.config.get('LAST_FRAME_JPEG'), app.config.get('LAST_FRAME_HASH')
+            if frame_hash == last_hash:
+                app.config['LAST_FRAME_TIME'] = time.monotonic()
+                return last_jpeg, frame_hash
+        
+        # Resize for web display; the target size only changes with the
+        # source resolution so it is computed once and cached
+        source_size = screen_data.shape[:2]
+        cached = app.config.get('SCREEN_SIZE')
+        if cached is None or cached[0] != source_size:
+            height, width = source_size
+            if width > 800:
+                target_size = (800, int(height * 800 / width))
+            else:
+                target_size = None
+            cached = (source_size, target_size)
+            app.config['SCREEN_SIZE'] = cached
+        
+        if cached[1] is not None:
+            screen_data = cv2.resize(screen_data, cached[1], interpolation=cv2.INTER_AREA)
+        
+        # Encoders copy strided input internally; hand them a contiguous frame
+        # (a no-op after resize) and keep to a single baseline pass
+        screen_data = np.ascontiguousarray(screen_data)
+        if turbo_jpeg is not None:
+            jpeg = turbo_jpeg.encode(screen_data, quality=70, pixel_format=TJPF_BGR)
+        else:
+            _, buffer = cv2.imencode('.jpg', screen_data, [cv2.IMWRITE_JPEG_QUALITY, 70,
+                                                           cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+                                                           cv2.IMWRITE_JPEG_OPTIMIZE, 0])
+            jpeg = buffer.tobytes()
+        
+        with screen_lock:
+            app.config['LAST_FRAME_JPEG'] = jpeg
+            app.config['LAST_FRAME_HASH'] = frame_hash
+            app.config['LAST_FRAME_TIME'] = time.monotonic()
+        return jpeg, frame_hash
+    
+    def latest_screen():
+        """Return the most recent (jpeg_bytes, frame_hash) from the capture thread, or (None, None) if stale"""
+        now = time.monotonic()
+        app.config['SCREEN_LAST_VIEWED'] = now
+        with screen_lock:
+            if now - app.config.get('LAST_FRAME_TIME', 0.0) > FRAME_MAX_AGE:
+                return None, None
+            return app.config.get('LAST_FRAME_JPEG'), app.config.get('LAST_FRAME_HASH')
+    
+    def capture_loop():
+        """Capture and encode frames off the request threads while someone is watching"""
+        frame_interval = 1.0 / CAPTURE_FPS
+        while True:
+            started = time.monotonic()
+            if started - app.config['SCREEN_LAST_VIEWED'] > CAPTURE_IDLE_TIMEOUT:
+                time.sleep(frame_interval)
+                continue
+            
+            try:
+                encode_screen()
+            except Exception as e:
+                app.logger.error(f"Error capturing screen: {e}")
+            
+            time.sleep(max(0.0, frame_interval - (time.monotonic() - started)))
+    
+    screen_lock = threading.Lock()
+    stream_slots = threading.BoundedSemaphore(MAX_STREAM_VIEWERS)
+    app.config['SCREEN_LAST_VIEWED'] = time.monotonic()
+    threading.Thread(target=capture_loop, daemon=True, name='ScreenCapture').start()
+    
+    @app.route('/api/screen.jpg')
+    def get_screen():
+        """Get the current screen capture as a raw JPEG"""
+        try:
+            jpeg, frame_hash = latest_screen()
+            
+            if jpeg is None:
+                return jsonify({'error': 'Screen capture unavailable'}), 503
+            
+            etag = f'"{frame_hash}"'
+            if request.headers.get('If-None-Match') == etag:
+                return Response(status=304, headers={'ETag': etag})
+            
+            return Response(jpeg, mimetype='image/jpeg',
+                            headers={'Cache-Control': 'no-cache', 'ETag': etag})
+        except Exception as e:
+            app.logger.error(f"Error capturing screen: {e}")
             return jsonify({'error': str(e)}), 500
     
+    @app.route('/api/stream.mjpeg')
+    def stream_screen():
+        """Stream screen captures as multipart MJPEG over one connection"""
+        try:
+            fps = float(request.args.get('fps', CAPTURE_FPS))
+        except (TypeError, ValueError):
+            fps = CAPTURE_FPS
+        if not math.isfinite(fps):
+            fps = CAPTURE_FPS
+        fps = min(max(fps, 1.0), 30.0)
+        frame_interval = 1.0 / fps
+        
+        if not stream_slots.acquire(blocking=False):
+            return jsonify({'error': 'Too many screen streams'}), 503
+        
+        def generate():
+            last_sent = None
+            last_write = last_frame = time.monotonic()
+            while True:
+                started = time.monotonic()
+                jpeg, frame_hash = latest_screen()
+                
+                if jpeg is None:
+                    # End the stream once capture has been unavailable for a while
+                    if started - last_frame > CAPTURE_IDLE_TIMEOUT:
+                        return
+                else:
+                    last_frame = started
+                    # The browser keeps showing the last frame, so only send
+                    # changes, plus a periodic repeat; a write to a closed
+                    # connection is what ends the stream for a gone viewer
+                    if frame_hash != last_sent or started - last_write > CAPTURE_IDLE_TIMEOUT:
+                        last_sent = frame_hash
+                        last_write = started
+                        yield (b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: ' +
+                               str(len(jpeg)).encode() + b'\r\n\r\n' + jpeg + b'\r\n')
+                
+                time.sleep(max(0.0, frame_interval - (time.monotonic() - started)))
+        
+        response = Response(generate(), mimetype='multipart/x-mixed-replace; boundary=frame',
+                            headers={'Cache-Control': 'no-store'})
+        # The server closes the response when the stream ends or the viewer
+        # goes away, including before the first frame was sent
+        response.call_on_close(stream_slots.release)
+        return response
+    
     @app.route('/api/command', methods=['POST'])
     def execute_command():
         """Execute a command"""
@@ -78,13 +266,12 @@ def create_app(game_bot):
                 return jsonify({'error': 'No command provided'}), 400
             
             # Execute command
-            game_bot = app.config['GAME_BOT']
             result = game_bot.process_single_command(command)
             
             return jsonify({
                 'command': command,
                 'result': result,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time()
             })
         except Exception as e:
             app.logger.error(f"Error executing command: {e}")
@@ -94,9 +281,8 @@ def create_app(game_bot):
     def get_macros():
         """Get list of available macros"""
         try:
-            game_bot = app.config['GAME_BOT']
-            macros = game_bot.macro_system.list_macros()
-            return jsonify({'macros': macros})
+            macros = macro_system.list_macros()
+            return etag_jsonify({'macros': macros})
         except Exception as e:
             app.logger.error(f"Error getting macros: {e}")
             return jsonify({'error': str(e)}), 500
@@ -105,9 +291,8 @@ def create_app(game_bot):
     def get_knowledge():
         """Get knowledge base summary"""
         try:
-            game_bot = app.config['GAME_BOT']
-            knowledge = game_bot.knowledge_manager.get_knowledge_summary()
-            return jsonify(knowledge)
+            knowledge = knowledge_manager.get_knowledge_summary()
+            return etag_jsonify(knowledge)
         except Exception as e:
             app.logger.error(f"Error getting knowledge: {e}")
             return jsonify({'error': str(e)}), 500
@@ -124,16 +309,15 @@ def create_app(game_bot):
                 return jsonify({'error': 'No source provided'}), 400
             
             # Process learning request
-            game_bot = app.config['GAME_BOT']
             if source_type == 'url' or (source_type == 'auto' and source.startswith('http')):
-                result = game_bot.knowledge_manager.learn_from_url(source)
+                result = knowledge_manager.learn_from_url(source)
             else:
-                result = game_bot.knowledge_manager.learn_from_file(source)
+                result = knowledge_manager.learn_from_file(source)
             
             return jsonify({
                 'source': source,
                 'result': result,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': time.time()
             })
         except Exception as e:
             app.logger.error(f"Error learning from source: {e}")
@@ -159,8 +343,7 @@ def create_app(game_bot):
             data = request.get_json()
             mode = data.get('mode', 'item_learning')
             
-            game_bot = app.config['GAME_BOT']
-            result = game_bot.interactive_trainer.start_interactive_training(mode)
+            result = trainer.start_interactive_training(mode)
             
             return jsonify({'result': result, 'success': True})
         except Exception as e:
@@ -171,8 +354,7 @@ def create_app(game_bot):
     def stop_training():
         """Stop interactive training mode"""
         try:
-            game_bot = app.config['GAME_BOT']
-            result = game_bot.interactive_trainer.stop_interactive_training()
+            result = trainer.stop_interactive_training()
             
             return jsonify({'result': result, 'success': True})
         except Exception as e:
@@ -186,8 +368,7 @@ def create_app(game_bot):
             data = request.get_json()
             item_type = data.get('item_type')
             
-            game_bot = app.config['GAME_BOT']
-            result = game_bot.interactive_trainer.process_spacebar_input(item_type)
+            result = trainer.process_spacebar_input(item_type)
             
             return jsonify({'result': result, 'success': True})
         except Exception as e:
@@ -202,8 +383,7 @@ def create_app(game_bot):
             x = data.get('x')
             y = data.get('y')
             
-            game_bot = app.config['GAME_BOT']
-            result = game_bot.interactive_trainer.process_corner_click(x, y)
+            result = trainer.process_corner_click(x, y)
             
             return jsonify({'result': result, 'success': True})
         except Exception as e:
@@ -217,8 +397,7 @@ def create_app(game_bot):
             data = request.get_json()
             command = data.get('command', '')
             
-            game_bot = app.config['GAME_BOT']
-            result = game_bot.interactive_trainer.process_natural_language_command(command)
+            result = trainer.process_natural_language_command(command)
             
             return jsonify({'result': result, 'success': True})
         except Exception as e:
@@ -229,10 +408,9 @@ def create_app(game_bot):
     def get_training_status():
         """Get current training status"""
         try:
-            game_bot = app.config['GAME_BOT']
-            status = game_bot.interactive_trainer.get_training_status()
+            status = trainer.get_training_status()
             
-            return jsonify(status)
+            return etag_jsonify(status)
         except Exception as e:
             app.logger.error(f"Error getting training status: {e}")
             return jsonify({'error': str(e)}), 500
@@ -246,8 +424,7 @@ def create_app(game_bot):
             zone_type = data.get('zone_type')
             restrictions = data.get('restrictions', [])
             
-            game_bot = app.config['GAME_BOT']
-            result = game_bot.interactive_trainer.set_zone_type(zone_id, zone_type, restrictions)
+            result = trainer.set_zone_type(zone_id, zone_type, restrictions)
             
             return jsonify({'result': result, 'success': True})
         except Exception as e:
@@ -258,8 +435,7 @@ def create_app(game_bot):
     def analyze_similarities():
         """Analyze similarities between learned items"""
         try:
-            game_bot = app.config['GAME_BOT']
-            result = game_bot.interactive_trainer._analyze_item_similarities()
+            result = trainer._analyze_item_similarities()
             
             return jsonify({'result': result, 'success': True})
         except Exception as e:
@@ -272,8 +448,7 @@ def create_app(game_bot):
         try:
             threshold = float(request.args.get('threshold', 0.8))
             
-            game_bot = app.config['GAME_BOT']
-            matches = game_bot.interactive_trainer.find_similar_items_in_screen(threshold)
+            matches = trainer.find_similar_items_in_screen(threshold)
             
             return jsonify({'matches': matches, 'success': True})
         except Exception as e:
@@ -282,12 +457,26 @@ def create_app(game_bot):
     
     @app.route('/api/training/export')
     def export_training_data():
-        """Export all training data"""
+        """Export all training data, streamed one record at a time"""
         try:
-            game_bot = app.config['GAME_BOT']
-            data = game_bot.interactive_trainer.export_training_data()
+            def generate():
+                # Same shape as InteractiveTrainer.export_training_data(), built
+                # incrementally so large exports never sit in memory at once
+                yield b'{"learned_items":{'
+                section = 'learned_items'
+                first = True
+                for record_section, key, record in trainer.iter_training_data():
+                    if record_section != section:
+                        yield b'},"game_zones":{'
+                        section = record_section
+                        first = True
+                    yield (b'' if first else b',') + dumps_bytes(str(key)) + b':' + dumps_bytes(record)
+                    first = False
+                if section == 'learned_items':
+                    yield b'},"game_zones":{'
+                yield b'},"export_timestamp":' + dumps_bytes(time.time()) + b'}'
             
-            return jsonify(data)
+            return Response(stream_with_context(generate()), mimetype='application/json')
         except Exception as e:
             app.logger.error(f"Error exporting data: {e}")
             return jsonify({'error': str(e)}), 500
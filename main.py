@@ -125,6 +125,17 @@ Available Commands:
             self.logger.error(f"Error processing command '{command}': {e}")
             return f"Error: {e}"
 
+def serve_app(app, port=5000, threads=8):
+    """Serve the web interface with waitress, or Flask's server if it is missing"""
+    try:
+        from waitress import serve
+    except ImportError:
+        logging.getLogger('GameBot').warning("waitress not installed - using Flask development server")
+        app.run(host='0.0.0.0', port=port, threaded=True)
+        return
+    
+    serve(app, host='0.0.0.0', port=port, threads=threads)
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(description='AI Game Automation Bot')
@@ -135,6 +146,11 @@ def main():
     
     args = parser.parse_args()
     
+    # A packaged build launched by double-click gets no arguments; start the
+    # web interface rather than an interactive prompt
+    if getattr(sys, 'frozen', False) and len(sys.argv) == 1:
+        args.web = True
+    
     # Set logging level
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -150,7 +166,13 @@ def main():
         # Start web interface
         from app import create_app
         app = create_app(bot)
-        app.run(host='0.0.0.0', port=args.port, debug=args.debug)
+        print("Starting AI Game Bot...")
+        print(f"Web interface will be available at: http://localhost:{args.port}")
+        print("Press Ctrl+C to stop the bot")
+        if args.debug:
+            app.run(host='0.0.0.0', port=args.port, debug=True)
+        else:
+            serve_app(app, port=args.port)
     else:
         # Start interactive mode
         bot.start_interactive_mode()
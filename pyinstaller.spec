@@ -1,5 +1,7 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+import sys
+
 block_cipher = None
 
 a = Analysis(
@@ -10,15 +12,18 @@ a = Analysis(
         ('data', 'data'),
         ('static', 'static'),
         ('templates', 'templates'),
-        ('core', 'core'),
-        ('utils', 'utils'),
-        ('attached_assets', 'attached_assets'),
+        ('attached_assets/*.ahk', 'attached_assets'),
+        ('attached_assets/*.js', 'attached_assets'),
+        ('attached_assets/*.ts', 'attached_assets'),
+        ('attached_assets/*.py', 'attached_assets'),
+        ('attached_assets/*.txt', 'attached_assets'),
     ],
     hiddenimports=[
         'cv2',
         'numpy',
         'PIL',
         'flask',
+        'waitress',
         'pyautogui',
         'requests',
         'trafilatura',
@@ -29,7 +34,19 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'tests',
+        'pytest',
+        'tkinter',
+        'matplotlib',
+        'PyQt5',
+        'PyQt6',
+        'PySide2',
+        'PySide6',
+        'IPython',
+        'botocore',
+        'boto3',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -49,10 +66,10 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=False,
     upx_exclude=[],
     runtime_tmpdir=None,
-    console=True,
+    console=sys.platform != 'win32',
     disable_windowed_traceback=False,
     argv_emulation=False,
     target_arch=None,
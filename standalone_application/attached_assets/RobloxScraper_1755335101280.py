@@ -7,12 +7,138 @@ import os
 import sys
 import json
 import time
+import threading
+import shutil
+import tempfile
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from urllib.parse import urlparse
+from collections import deque
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
 import pyperclip  # pip install pyperclip
 
+# orjson is optional; it decodes API responses faster than the stdlib
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# URL pattern for extract_id_from_url; the name of the matched group gives
+# the ID type (see _URL_ID_TYPES)
+_RE_URL = re.compile(
+    r'games/(?P<game>\d+)'
+    r'|users/(?P<user>\d+)|profile/(?P<user2>\d+)'
+    r'|groups/(?P<group>\d+)'
+    r'|catalog/(?P<asset>\d+)|asset/(?P<asset2>\d+)'
+)
+_URL_ID_TYPES = MappingProxyType({
+    "game": "game",
+    "user": "user",
+    "user2": "user",
+    "group": "group",
+    "asset": "asset",
+    "asset2": "asset",
+})
+
+# Broader patterns for scanning clipboard text in a single pass; the name of
+# the matched group is the ID type
+_RE_CB_ALL = re.compile(
+    r'(?:games|places|place\?id=)/(?P<game>\d+)'
+    r'|(?:users|profile)/(?P<user>\d+)'
+    r'|groups/(?P<group>\d+)'
+    r'|(?:catalog|asset|library)/(?P<asset>\d+)'
+)
+_RE_RAW = re.compile(r'(?<!\d)(\d{8,19})(?!\d)')
+
+# Concurrent requests allowed to any one Roblox API host
+HOST_CONCURRENCY = 4
+
+# Largest API response body the scraper will download and parse
+MAX_RESPONSE_BYTES = 1024 * 1024
+
+# Successful lookups remembered per ID type (oldest are forgotten first)
+FETCH_CACHE_SIZE = 512
+
+# Roblox asset type IDs, read-only
+_ASSET_TYPE_NAMES = MappingProxyType({
+    1: "Image",
+    2: "T-Shirt",
+    3: "Audio",
+    4: "Mesh",
+    5: "Lua",
+    6: "HTML",
+    7: "Text",
+    8: "Hat",
+    9: "Place",
+    10: "Model",
+    11: "Shirt",
+    12: "Pants",
+    13: "Decal",
+    16: "Avatar",
+    17: "Head",
+    18: "Face",
+    19: "Gear",
+    21: "Badge",
+    22: "Group Emblem",
+    24: "Animation",
+    25: "Arms",
+    26: "Legs",
+    27: "Torso",
+    28: "Right Arm",
+    29: "Left Arm",
+    30: "Left Leg",
+    31: "Right Leg",
+    32: "Package",
+    33: "YouTube Video",
+    34: "Game Pass",
+    35: "App",
+    37: "Code",
+    38: "Plugin",
+    39: "SolidModel",
+    40: "MeshPart",
+    41: "Hair Accessory",
+    42: "Face Accessory",
+    43: "Neck Accessory",
+    44: "Shoulder Accessory",
+    45: "Front Accessory",
+    46: "Back Accessory",
+    47: "Waist Accessory",
+    48: "Climb Animation",
+    49: "Death Animation",
+    50: "Fall Animation",
+    51: "Idle Animation",
+    52: "Jump Animation",
+    53: "Run Animation",
+    54: "Swim Animation",
+    55: "Walk Animation",
+    56: "Pose Animation",
+    59: "LocalizationTableManifest",
+    60: "LocalizationTableTranslation",
+    61: "Emote Animation",
+    62: "Video",
+    63: "TexturePack",
+    64: "T-Shirt Accessory",
+    65: "Shirt Accessory",
+    66: "Pants Accessory",
+    67: "Jacket Accessory",
+    68: "Sweater Accessory",
+    69: "Shorts Accessory",
+    70: "Left Shoe Accessory",
+    71: "Right Shoe Accessory",
+    72: "Dress Skirt Accessory"
+})
+
+# "Name (ID: n)" labels for the asset type line, built once
+_ASSET_TYPE_DISPLAY = MappingProxyType({
+    type_id: f"{name} (ID: {type_id})" for type_id, name in _ASSET_TYPE_NAMES.items()
+})
+
 class RobloxScraper:
     def __init__(self, master):
         self.master = master
@@ -49,10 +175,12 @@ class RobloxScraper:
         button_frame = ttk.Frame(self.main_frame)
         button_frame.pack(fill=tk.X, padx=5, pady=5)
         
-        ttk.Button(button_frame, text="Scrape Info", command=self.scrape_info).pack(side=tk.LEFT, padx=5)
+        self.scrape_button = ttk.Button(button_frame, text="Scrape Info", command=self.scrape_info)
+        self.scrape_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Clear Results", command=self.clear_results).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Save Results", command=self.save_results).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="From Clipboard", command=self.extract_from_clipboard).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Clear Cache", command=self.clear_cache).pack(side=tk.LEFT, padx=5)
         
         # Checkbox frame
         checkbox_frame = ttk.Frame(self.main_frame)
@@ -78,6 +206,16 @@ class RobloxScraper:
         self.results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         self.results_text.insert(tk.END, "Enter a Roblox URL or ID to extract information.\n")
         
+        # Appended lines are buffered and inserted together on a short timer
+        self.pending_lines = []
+        self.flush_scheduled = False
+        
+        # Everything shown in the results area is also appended to a temp
+        # log, so saving copies that file instead of reading the whole widget
+        log_fd, self.log_path = tempfile.mkstemp(prefix="roblox_scraper_", suffix=".log")
+        self.log_file = open(log_fd, 'w', encoding='utf-8', buffering=8192)
+        self.log_file.write("Enter a Roblox URL or ID to extract information.\n")
+        
         # Status bar
         self.status_var = tk.StringVar(value="Status: Ready")
         status_bar = ttk.Label(self.master, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
@@ -86,57 +224,181 @@ class RobloxScraper:
         # Set focus to entry
         self.input_entry.focus_set()
         master.bind('<Return>', lambda event: self.scrape_info())
+        
+        # Shared HTTP session so repeated calls to the same Roblox hosts reuse
+        # connections instead of paying a TCP+TLS handshake each time
+        self.session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=20, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": "RobloxDataScraper/1.0",
+            "Accept": "application/json"
+        })
+        master.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # At most HOST_CONCURRENCY requests in flight per host, so clipboard
+        # fan-out doesn't trip Roblox's rate limiter into 429 back-off
+        self.host_limits = {}
+        self.host_limits_lock = threading.Lock()
+        
+        # API lookups run off the Tk thread so the window stays responsive;
+        # results are rendered on the Tk thread in the order they were queued
+        self.executor = ThreadPoolExecutor(max_workers=8)
+        self.pending_scrapes = deque()
+        
+        # Separate pool for requests issued from inside a lookup, so a full
+        # lookup pool can't deadlock waiting on its own sub-requests
+        self.subrequest_executor = ThreadPoolExecutor(max_workers=8)
+        
+        # Remember lookups by ID so repeated IDs (within one paste, or across
+        # clicks) don't hit the API again; "Clear Cache" forgets them
+        self.fetch_game_info = self.cache_successes(self.fetch_game_info)
+        self.fetch_user_info = self.cache_successes(self.fetch_user_info)
+        self.fetch_group_info = self.cache_successes(self.fetch_group_info)
+        self.fetch_asset_info = self.cache_successes(self.fetch_asset_info)
+    
+    def cache_successes(self, fetch):
+        """Wrap a fetch_* method so it remembers results by ID
+        
+        None (a failed request or an invalid ID) is never cached, so a
+        timeout or rate limit doesn't hide an ID until the cache is cleared.
+        """
+        cache = {}
+        
+        def cached_fetch(roblox_id):
+            result = cache.get(roblox_id)
+            if result is not None:
+                cached_fetch.hits += 1
+                return result
+            
+            cached_fetch.misses += 1
+            result = fetch(roblox_id)
+            if result is not None:
+                if len(cache) >= FETCH_CACHE_SIZE:
+                    cache.pop(next(iter(cache)), None)
+                cache[roblox_id] = result
+            return result
+        
+        cached_fetch.cache = cache
+        cached_fetch.hits = cached_fetch.misses = 0
+        return cached_fetch
+    
+    def on_close(self):
+        """Release network resources and close the window"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.subrequest_executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        self.log_file.close()
+        try:
+            os.remove(self.log_path)
+        except OSError:
+            pass
+        self.master.destroy()
 
     def append_result(self, text):
         """Append text to results"""
-        self.results_text.insert(tk.END, text + "\n")
+        self.pending_lines.append(text)
+        if not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.master.after(50, self.flush_results)
+    
+    def flush_results(self):
+        """Insert buffered lines into the results area in one call"""
+        self.flush_scheduled = False
+        if not self.pending_lines:
+            return
+        text = "\n".join(self.pending_lines) + "\n"
+        self.results_text.insert(tk.END, text)
         self.results_text.see(tk.END)
-        self.master.update_idletasks()
+        self.log_file.write(text)
+        self.pending_lines.clear()
     
     def set_status(self, text):
-        """Update status bar text"""
+        """Update status bar text (may be called from worker threads)"""
+        if threading.current_thread() is not threading.main_thread():
+            self.master.after(0, self.set_status, text)
+            return
         self.status_var.set(f"Status: {text}")
-        self.master.update_idletasks()
+    
+    def queue_scrapes(self, items):
+        """Queue text lines and (fetch, render, id) jobs; fetches run concurrently"""
+        for item in items:
+            if isinstance(item, str):
+                self.pending_scrapes.append(item)
+                continue
+            
+            fetch, render, roblox_id = item
+            future = self.executor.submit(fetch, roblox_id)
+            self.pending_scrapes.append((future, render, roblox_id))
+            future.add_done_callback(lambda _: self.master.after(0, self.drain_scrapes))
+        
+        if self.pending_scrapes:
+            self.scrape_button.config(state=tk.DISABLED)
+        self.drain_scrapes()
+    
+    def drain_scrapes(self):
+        """Render finished scrapes from the front of the queue, preserving order"""
+        while self.pending_scrapes:
+            item = self.pending_scrapes[0]
+            if isinstance(item, str):
+                self.pending_scrapes.popleft()
+                self.append_result(item)
+                continue
+            
+            future, render, roblox_id = item
+            if not future.done():
+                return
+            
+            self.pending_scrapes.popleft()
+            try:
+                # One insert per scrape rather than one per line
+                self.append_result("\n".join(render(roblox_id, future.result())))
+            except Exception as e:
+                self.append_result(f"Error processing {roblox_id}: {str(e)}")
+        
+        self.scrape_button.config(state=tk.NORMAL)
+        self.set_status("Ready")
     
     def clear_results(self):
         """Clear the results text area"""
+        self.pending_lines.clear()
         self.results_text.delete(1.0, tk.END)
         self.results_text.insert(tk.END, "Enter a Roblox URL or ID to extract information.\n")
+        self.log_file.seek(0)
+        self.log_file.truncate()
+        self.log_file.write("Enter a Roblox URL or ID to extract information.\n")
         self.input_var.set("")
     
+    def clear_cache(self):
+        """Forget cached lookups so the next scrape fetches fresh data"""
+        fetchers = [self.fetch_game_info, self.fetch_user_info, self.fetch_group_info, self.fetch_asset_info]
+        hits = sum(fetch.hits for fetch in fetchers)
+        misses = sum(fetch.misses for fetch in fetchers)
+        for fetch in fetchers:
+            fetch.cache.clear()
+            fetch.hits = fetch.misses = 0
+        self.set_status(f"Cache cleared ({hits} hits, {misses} misses)")
+    
     def save_results(self):
         """Save results to a file"""
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         filename = f"RobloxInfo_{timestamp}.txt"
+        self.flush_results()
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(self.results_text.get(1.0, tk.END))
+            self.log_file.flush()
+            shutil.copyfile(self.log_path, filename)
             messagebox.showinfo("Success", f"Results saved to {filename}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save results: {str(e)}")
     
     def extract_id_from_url(self, url):
         """Extract Roblox IDs from URL"""
-        # Game ID
-        game_match = re.search(r'games/(\d+)', url)
-        if game_match:
-            return game_match.group(1), "game"
-        
-        # User ID
-        user_match = re.search(r'users/(\d+)|profile/(\d+)', url)
-        if user_match:
-            return user_match.group(1) if user_match.group(1) else user_match.group(2), "user"
-        
-        # Group ID
-        group_match = re.search(r'groups/(\d+)', url)
-        if group_match:
-            return group_match.group(1), "group"
-        
-        # Asset ID
-        asset_match = re.search(r'catalog/(\d+)|asset/(\d+)', url)
-        if asset_match:
-            return asset_match.group(1) if asset_match.group(1) else asset_match.group(2), "asset"
+        match = _RE_URL.search(url)
+        if match:
+            return match.group(match.lastgroup), _URL_ID_TYPES[match.lastgroup]
         
         # If it's just a number, return it without type
         if url.isdigit():
@@ -146,6 +408,10 @@ class RobloxScraper:
     
     def scrape_info(self):
         """Main function to scrape Roblox info"""
+        if self.pending_scrapes:
+            self.set_status("Still scraping, please wait...")
+            return
+        
         input_text = self.input_var.get().strip()
         if not input_text:
             self.append_result("Error: Please enter a Roblox URL or ID")
@@ -166,53 +432,82 @@ class RobloxScraper:
         if id_type == "unknown":
             self.append_result("Testing as multiple ID types...")
             
+            jobs = []
             if self.scrape_game.get():
-                self.scrape_game_info(roblox_id)
+                jobs.append((self.fetch_game_info, self.render_game_info, roblox_id))
             
             if self.scrape_user.get():
-                self.scrape_user_info(roblox_id)
+                jobs.append((self.fetch_user_info, self.render_user_info, roblox_id))
             
             if self.scrape_group.get():
-                self.scrape_group_info(roblox_id)
+                jobs.append((self.fetch_group_info, self.render_group_info, roblox_id))
             
             if self.scrape_asset.get():
-                self.scrape_asset_info(roblox_id)
+                jobs.append((self.fetch_asset_info, self.render_asset_info, roblox_id))
+            
+            self.queue_scrapes(jobs)
         else:
             # Specific type known
             if id_type == "game" and self.scrape_game.get():
-                self.scrape_game_info(roblox_id)
+                self.queue_scrapes([(self.fetch_game_info, self.render_game_info, roblox_id)])
             elif id_type == "user" and self.scrape_user.get():
-                self.scrape_user_info(roblox_id)
+                self.queue_scrapes([(self.fetch_user_info, self.render_user_info, roblox_id)])
             elif id_type == "group" and self.scrape_group.get():
-                self.scrape_group_info(roblox_id)
+                self.queue_scrapes([(self.fetch_group_info, self.render_group_info, roblox_id)])
             elif id_type == "asset" and self.scrape_asset.get():
-                self.scrape_asset_info(roblox_id)
+                self.queue_scrapes([(self.fetch_asset_info, self.render_asset_info, roblox_id)])
             else:
                 self.append_result(f"Scraping for {id_type} type is disabled in settings")
     
     def make_request(self, url, headers=None):
         """Make a request with error handling"""
         try:
-            if headers:
-                response = requests.get(url, headers=headers, timeout=10)
-            else:
-                response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                self.set_status(f"Request failed with status code {response.status_code}")
-                return None
+            # Stream the body so oversized responses are rejected before
+            # they are fully downloaded and parsed
+            with self.host_limit(url), \
+                    self.session.get(url, headers=headers, timeout=10, stream=True) as response:
+                if response.status_code != 200:
+                    self.set_status(f"Request failed with status code {response.status_code}")
+                    return None
+                
+                body = self.read_capped(response)
+                if body is None:
+                    self.set_status(f"Response too large (over {MAX_RESPONSE_BYTES // 1024} KB)")
+                    return None
+                
+                return _json_loads(body)
         except requests.exceptions.RequestException as e:
             self.set_status(f"Request error: {str(e)}")
             return None
-        except json.JSONDecodeError:
+        except ValueError:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError
             self.set_status("Received invalid JSON response")
             return None
     
-    def scrape_game_info(self, game_id):
-        """Scrape information about a Roblox game"""
-        self.append_result("\nChecking as Game/Place ID: " + game_id)
+    def host_limit(self, url):
+        """Get the semaphore throttling requests to the host of url"""
+        host = urlparse(url).netloc
+        with self.host_limits_lock:
+            limit = self.host_limits.get(host)
+            if limit is None:
+                limit = self.host_limits[host] = threading.Semaphore(HOST_CONCURRENCY)
+        return limit
+    
+    def read_capped(self, response):
+        """Read a streamed response body, or return None if it exceeds MAX_RESPONSE_BYTES"""
+        length = response.headers.get("content-length")
+        if length and length.isdigit() and int(length) > MAX_RESPONSE_BYTES:
+            return None
+        
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            body.extend(chunk)
+            if len(body) > MAX_RESPONSE_BYTES:
+                return None
+        return bytes(body)
+    
+    def fetch_game_info(self, game_id):
+        """Fetch universe and game details for a place ID, or None if invalid"""
         self.set_status("Fetching game universe information...")
         
         # Get universe ID
@@ -220,38 +515,59 @@ class RobloxScraper:
         universe_data = self.make_request(universe_url)
         
         if not universe_data or "universeId" not in universe_data:
-            self.append_result("✗ Not a valid Game/Place ID")
-            return
+            return None
         
         universe_id = universe_data["universeId"]
-        self.append_result("✓ VALID GAME/PLACE ID")
-        self.append_result(f"  Place ID: {game_id}")
-        self.append_result(f"  Universe ID: {universe_id}")
         
-        # Get game details
+        # Details, votes and favorites only depend on the universe ID, so
+        # they are requested together over the shared connection pool
         self.set_status("Fetching game details...")
-        game_url = f"https://games.roblox.com/v1/games?universeIds={universe_id}"
-        game_data = self.make_request(game_url)
+        game_data, votes_data, favorites_data = self.subrequest_executor.map(self.make_request, [
+            f"https://games.roblox.com/v1/games?universeIds={universe_id}",
+            f"https://games.roblox.com/v1/games/votes?universeIds={universe_id}",
+            f"https://games.roblox.com/v1/games/{universe_id}/favorites/count",
+        ])
+        
+        return {
+            "universe_id": universe_id,
+            "game_data": game_data,
+            "votes_data": votes_data,
+            "favorites_data": favorites_data
+        }
+    
+    def render_game_info(self, game_id, info):
+        """Format fetched game information as result lines"""
+        out = ["\nChecking as Game/Place ID: " + game_id]
         
+        if not info:
+            out.append("✗ Not a valid Game/Place ID")
+            return out
+        
+        universe_id = info["universe_id"]
+        out.append("✓ VALID GAME/PLACE ID")
+        out.append(f"  Place ID: {game_id}")
+        out.append(f"  Universe ID: {universe_id}")
+        
+        game_data = info["game_data"]
         if game_data and "data" in game_data and len(game_data["data"]) > 0:
             game_info = game_data["data"][0]
             
             # Game name & description
             game_name = game_info.get("name", "Unknown")
-            self.append_result(f"  Game Name: {game_name}")
+            out.append(f"  Game Name: {game_name}")
             
             description = game_info.get("description", "")
             if description and len(description) > 0:
                 # Truncate long descriptions
                 if len(description) > 200:
                     description = description[:197] + "..."
-                self.append_result(f"  Description: {description}")
+                out.append(f"  Description: {description}")
             
             # Root place
             root_place_id = game_info.get("rootPlaceId", "Unknown")
             if root_place_id != game_id:
-                self.append_result(f"  Root Place ID: {root_place_id}")
-                self.append_result("  This appears to be a private server or alternate place")
+                out.append(f"  Root Place ID: {root_place_id}")
+                out.append("  This appears to be a private server or alternate place")
             
             # Creator info
             creator = game_info.get("creator", {})
@@ -259,38 +575,50 @@ class RobloxScraper:
             creator_name = creator.get("name", "Unknown")
             creator_type = creator.get("type", "Unknown")
             
-            self.append_result(f"  Creator ID: {creator_id}")
-            self.append_result(f"  Creator Name: {creator_name}")
-            self.append_result(f"  Creator Type: {creator_type}")
+            out.append(f"  Creator ID: {creator_id}")
+            out.append(f"  Creator Name: {creator_name}")
+            out.append(f"  Creator Type: {creator_type}")
             
             # Player stats
             playing = game_info.get("playing", 0)
             visits = game_info.get("visits", 0)
-            self.append_result(f"  Current Players: {playing}")
-            self.append_result(f"  Total Visits: {visits}")
+            out.append(f"  Current Players: {playing}")
+            out.append(f"  Total Visits: {visits}")
+            
+            votes_data = info["votes_data"]
+            if votes_data and votes_data.get("data"):
+                votes = votes_data["data"][0]
+                out.append(f"  Likes: {votes.get('upVotes', 0)}")
+                out.append(f"  Dislikes: {votes.get('downVotes', 0)}")
+            
+            favorites_data = info["favorites_data"]
+            if favorites_data and "favoritesCount" in favorites_data:
+                out.append(f"  Favorites: {favorites_data['favoritesCount']}")
             
             # Dates
             created = game_info.get("created", "")
             updated = game_info.get("updated", "")
             if created:
                 created_date = created.split("T")[0]
-                self.append_result(f"  Created: {created_date}")
+                out.append(f"  Created: {created_date}")
             if updated:
                 updated_date = updated.split("T")[0]
-                self.append_result(f"  Last Updated: {updated_date}")
+                out.append(f"  Last Updated: {updated_date}")
             
             # Access methods
-            self.append_result("\n  Access URLs:")
-            self.append_result(f"  - https://www.roblox.com/games/{game_id}")
-            self.append_result(f"  - https://www.roblox.com/games/{root_place_id}")
+            out.append(f"""
+  Access URLs:
+  - https://www.roblox.com/games/{game_id}
+  - https://www.roblox.com/games/{root_place_id}""")
             
             # Private servers
             create_vip = game_info.get("createVipServersAllowed", False)
-            self.append_result(f"  Private Servers Allowed: {'Yes' if create_vip else 'No'}")
-    
-    def scrape_user_info(self, user_id):
-        """Scrape information about a Roblox user"""
-        self.append_result("\nChecking as User ID: " + user_id)
+            out.append(f"  Private Servers Allowed: {'Yes' if create_vip else 'No'}")
+        
+        return out
+
+    def fetch_user_info(self, user_id):
+        """Fetch a user's profile and games, or None if invalid"""
         self.set_status("Fetching user information...")
         
         # Get user info
@@ -298,28 +626,44 @@ class RobloxScraper:
         user_data = self.make_request(user_url)
         
         if not user_data or "name" not in user_data:
-            self.append_result("✗ Not a valid User ID")
-            return
+            return None
         
-        self.append_result("✓ VALID USER ID")
+        # Get user's games
+        self.set_status("Fetching user's games...")
+        games_url = f"https://games.roblox.com/v2/users/{user_id}/games?sortOrder=Desc&limit=10"
+        games_data = self.make_request(games_url)
+        
+        return {"user_data": user_data, "games_data": games_data}
+    
+    def render_user_info(self, user_id, info):
+        """Format fetched user information as result lines"""
+        out = ["\nChecking as User ID: " + user_id]
+        
+        if not info:
+            out.append("✗ Not a valid User ID")
+            return out
+        
+        user_data = info["user_data"]
+        
+        out.append("✓ VALID USER ID")
         
         # Basic info
         username = user_data.get("name", "Unknown")
         display_name = user_data.get("displayName", "Unknown")
         
-        self.append_result(f"  User ID: {user_id}")
-        self.append_result(f"  Username: {username}")
-        self.append_result(f"  Display Name: {display_name}")
+        out.append(f"  User ID: {user_id}")
+        out.append(f"  Username: {username}")
+        out.append(f"  Display Name: {display_name}")
         
         # Account info
         created = user_data.get("created", "")
         if created:
             created_date = created.split("T")[0]
-            self.append_result(f"  Account Created: {created_date}")
+            out.append(f"  Account Created: {created_date}")
         
         is_banned = user_data.get("isBanned", False)
         if is_banned:
-            self.append_result("  Account Status: BANNED")
+            out.append("  Account Status: BANNED")
         
         # Description
         description = user_data.get("description", "")
@@ -327,33 +671,31 @@ class RobloxScraper:
             # Truncate long descriptions
             if len(description) > 200:
                 description = description[:197] + "..."
-            self.append_result(f"  Description: {description}")
+            out.append(f"  Description: {description}")
         
         # User URLs
-        self.append_result("\n  Access URLs:")
-        self.append_result(f"  - https://www.roblox.com/users/{user_id}/profile")
-        
-        # Get user's games
-        self.set_status("Fetching user's games...")
-        games_url = f"https://games.roblox.com/v2/users/{user_id}/games?sortOrder=Desc&limit=10"
-        games_data = self.make_request(games_url)
+        out.append(f"""
+  Access URLs:
+  - https://www.roblox.com/users/{user_id}/profile""")
         
+        games_data = info["games_data"]
         if games_data and "data" in games_data and len(games_data["data"]) > 0:
-            self.append_result("\n  User's Games:")
-            for i, game in enumerate(games_data["data"]):
-                if i >= 5:  # Limit to 5 games
-                    self.append_result(f"  ... and {len(games_data['data']) - 5} more")
-                    break
-                
+            out.append("\n  User's Games:")
+            # Limit to 5 games
+            games = games_data["data"]
+            for game in games[:5]:
                 game_name = game.get("name", "Unknown")
                 game_id = game.get("id", "Unknown")
                 place_id = game.get("rootPlace", {}).get("id", "Unknown")
                 
-                self.append_result(f"  - {game_name} (ID: {game_id})")
-    
-    def scrape_group_info(self, group_id):
-        """Scrape information about a Roblox group"""
-        self.append_result("\nChecking as Group ID: " + group_id)
+                out.append(f"  - {game_name} (ID: {game_id})")
+            if len(games) > 5:
+                out.append(f"  ... and {len(games) - 5} more")
+        
+        return out
+
+    def fetch_group_info(self, group_id):
+        """Fetch a group's details and games, or None if invalid"""
         self.set_status("Fetching group information...")
         
         # Get group info
@@ -361,19 +703,35 @@ class RobloxScraper:
         group_data = self.make_request(group_url)
         
         if not group_data or "name" not in group_data:
-            self.append_result("✗ Not a valid Group ID")
-            return
+            return None
         
-        self.append_result("✓ VALID GROUP ID")
+        # Get group's games
+        self.set_status("Fetching group's games...")
+        games_url = f"https://games.roblox.com/v2/groups/{group_id}/games?sortOrder=Desc&limit=10"
+        games_data = self.make_request(games_url)
+        
+        return {"group_data": group_data, "games_data": games_data}
+    
+    def render_group_info(self, group_id, info):
+        """Format fetched group information as result lines"""
+        out = ["\nChecking as Group ID: " + group_id]
+        
+        if not info:
+            out.append("✗ Not a valid Group ID")
+            return out
+        
+        group_data = info["group_data"]
+        
+        out.append("✓ VALID GROUP ID")
         
         # Basic info
         group_name = group_data.get("name", "Unknown")
-        self.append_result(f"  Group ID: {group_id}")
-        self.append_result(f"  Group Name: {group_name}")
+        out.append(f"  Group ID: {group_id}")
+        out.append(f"  Group Name: {group_name}")
         
         # Member count
         member_count = group_data.get("memberCount", 0)
-        self.append_result(f"  Member Count: {member_count}")
+        out.append(f"  Member Count: {member_count}")
         
         # Owner info
         owner = group_data.get("owner")
@@ -381,10 +739,10 @@ class RobloxScraper:
             owner_id = owner.get("userId", "Unknown")
             owner_name = owner.get("username", "Unknown")
             
-            self.append_result(f"  Owner ID: {owner_id}")
-            self.append_result(f"  Owner Name: {owner_name}")
+            out.append(f"  Owner ID: {owner_id}")
+            out.append(f"  Owner Name: {owner_name}")
         else:
-            self.append_result("  Owner: None (Group may be owned by Roblox)")
+            out.append("  Owner: None (Group may be owned by Roblox)")
         
         # Description
         description = group_data.get("description", "")
@@ -392,32 +750,30 @@ class RobloxScraper:
             # Truncate long descriptions
             if len(description) > 200:
                 description = description[:197] + "..."
-            self.append_result(f"  Description: {description}")
+            out.append(f"  Description: {description}")
         
         # Group URLs
-        self.append_result("\n  Access URLs:")
-        self.append_result(f"  - https://www.roblox.com/groups/{group_id}")
-        
-        # Get group's games
-        self.set_status("Fetching group's games...")
-        games_url = f"https://games.roblox.com/v2/groups/{group_id}/games?sortOrder=Desc&limit=10"
-        games_data = self.make_request(games_url)
+        out.append(f"""
+  Access URLs:
+  - https://www.roblox.com/groups/{group_id}""")
         
+        games_data = info["games_data"]
         if games_data and "data" in games_data and len(games_data["data"]) > 0:
-            self.append_result("\n  Group's Games:")
-            for i, game in enumerate(games_data["data"]):
-                if i >= 5:  # Limit to 5 games
-                    self.append_result(f"  ... and {len(games_data['data']) - 5} more")
-                    break
-                
+            out.append("\n  Group's Games:")
+            # Limit to 5 games
+            games = games_data["data"]
+            for game in games[:5]:
                 game_name = game.get("name", "Unknown")
                 game_id = game.get("id", "Unknown")
                 
-                self.append_result(f"  - {game_name} (ID: {game_id})")
-    
-    def scrape_asset_info(self, asset_id):
-        """Scrape information about a Roblox asset"""
-        self.append_result("\nChecking as Asset ID: " + asset_id)
+                out.append(f"  - {game_name} (ID: {game_id})")
+            if len(games) > 5:
+                out.append(f"  ... and {len(games) - 5} more")
+        
+        return out
+
+    def fetch_asset_info(self, asset_id):
+        """Fetch an asset's details, or None if invalid"""
         self.set_status("Fetching asset information...")
         
         # Get asset info
@@ -425,40 +781,51 @@ class RobloxScraper:
         asset_data = self.make_request(asset_url)
         
         if not asset_data or "Name" not in asset_data:
-            self.append_result("✗ Not a valid Asset ID")
-            return
+            return None
+        
+        return asset_data
+    
+    def render_asset_info(self, asset_id, asset_data):
+        """Format fetched asset information as result lines"""
+        out = ["\nChecking as Asset ID: " + asset_id]
         
-        self.append_result("✓ VALID ASSET ID")
+        if not asset_data:
+            out.append("✗ Not a valid Asset ID")
+            return out
+        
+        out.append("✓ VALID ASSET ID")
         
         # Basic info
         asset_name = asset_data.get("Name", "Unknown")
-        self.append_result(f"  Asset ID: {asset_id}")
-        self.append_result(f"  Asset Name: {asset_name}")
+        out.append(f"  Asset ID: {asset_id}")
+        out.append(f"  Asset Name: {asset_name}")
         
         # Asset type
         asset_type = asset_data.get("AssetTypeId", 0)
-        asset_type_name = self.get_asset_type_name(asset_type)
-        self.append_result(f"  Asset Type: {asset_type_name} (ID: {asset_type})")
+        asset_type_display = _ASSET_TYPE_DISPLAY.get(asset_type)
+        if asset_type_display is None:
+            asset_type_display = f"Unknown Type ({asset_type}) (ID: {asset_type})"
+        out.append(f"  Asset Type: {asset_type_display}")
         
         # Creator info
         creator_id = asset_data.get("CreatorTargetId", "Unknown")
         creator_type = asset_data.get("CreatorType", "Unknown")
         creator_name = asset_data.get("Creator", {}).get("Name", "Unknown")
         
-        self.append_result(f"  Creator ID: {creator_id}")
-        self.append_result(f"  Creator Name: {creator_name}")
-        self.append_result(f"  Creator Type: {creator_type}")
+        out.append(f"  Creator ID: {creator_id}")
+        out.append(f"  Creator Name: {creator_name}")
+        out.append(f"  Creator Type: {creator_type}")
         
         # Sales info
         is_for_sale = asset_data.get("IsForSale", False)
         is_limited = asset_data.get("IsLimited", False) or asset_data.get("IsLimitedUnique", False)
         price = asset_data.get("PriceInRobux", 0)
         
-        self.append_result(f"  For Sale: {'Yes' if is_for_sale else 'No'}")
+        out.append(f"  For Sale: {'Yes' if is_for_sale else 'No'}")
         if is_for_sale:
-            self.append_result(f"  Price: {price} Robux")
+            out.append(f"  Price: {price} Robux")
         
-        self.append_result(f"  Limited Item: {'Yes' if is_limited else 'No'}")
+        out.append(f"  Limited Item: {'Yes' if is_limited else 'No'}")
         
         # Dates
         created = asset_data.get("Created", "")
@@ -466,17 +833,20 @@ class RobloxScraper:
         
         if created:
             created_date = created.split("T")[0]
-            self.append_result(f"  Created: {created_date}")
+            out.append(f"  Created: {created_date}")
         
         if updated:
             updated_date = updated.split("T")[0]
-            self.append_result(f"  Last Updated: {updated_date}")
+            out.append(f"  Last Updated: {updated_date}")
         
         # Asset URLs
-        self.append_result("\n  Access URLs:")
-        self.append_result(f"  - https://www.roblox.com/catalog/{asset_id}")
-        self.append_result(f"  - https://www.roblox.com/library/{asset_id}")
-    
+        out.append(f"""
+  Access URLs:
+  - https://www.roblox.com/catalog/{asset_id}
+  - https://www.roblox.com/library/{asset_id}""")
+        
+        return out
+
     def extract_from_clipboard(self):
         """Extract Roblox IDs from clipboard"""
         clipboard_text = pyperclip.paste()
@@ -486,26 +856,23 @@ class RobloxScraper:
         
         self.append_result("\nExtracting Roblox IDs from clipboard...")
         
-        # Find all game/place IDs
-        game_ids = re.findall(r'(?:games|places|place\?id=)\/(\d+)', clipboard_text)
-        # Find all user IDs
-        user_ids = re.findall(r'(?:users|profile)\/(\d+)', clipboard_text)
-        # Find all group IDs
-        group_ids = re.findall(r'groups\/(\d+)', clipboard_text)
-        # Find all asset IDs
-        asset_ids = re.findall(r'(?:catalog|asset|library)\/(\d+)', clipboard_text)
-        
-        # Remove duplicates
-        game_ids = list(set(game_ids))
-        user_ids = list(set(user_ids))
-        group_ids = list(set(group_ids))
-        asset_ids = list(set(asset_ids))
+        # Find all game/place, user, group and asset IDs in one scan
+        found = {"game": set(), "user": set(), "group": set(), "asset": set()}
+        for match in _RE_CB_ALL.finditer(clipboard_text):
+            found[match.lastgroup].add(match.group(match.lastgroup))
+        game_ids = found["game"]
+        user_ids = found["user"]
+        group_ids = found["group"]
+        asset_ids = found["asset"]
         
         # Also try to find raw numeric IDs that might be Roblox IDs
-        raw_ids = re.findall(r'(?<!\d)(\d{8,19})(?!\d)', clipboard_text)
-        raw_ids = [id for id in raw_ids if id not in game_ids and id not in user_ids and 
-                  id not in group_ids and id not in asset_ids]
-        raw_ids = list(set(raw_ids))
+        typed_ids = game_ids | user_ids | group_ids | asset_ids
+        raw_ids = list(set(_RE_RAW.findall(clipboard_text)) - typed_ids)
+        
+        game_ids = list(game_ids)
+        user_ids = list(user_ids)
+        group_ids = list(group_ids)
+        asset_ids = list(asset_ids)
         
         # Check if we found any IDs
         total_ids = len(game_ids) + len(user_ids) + len(group_ids) + len(asset_ids) + len(raw_ids)
@@ -516,117 +883,33 @@ class RobloxScraper:
         
         self.append_result(f"Found {total_ids} potential Roblox IDs")
         
-        # Process found IDs
-        if game_ids and self.scrape_game.get():
-            self.append_result(f"\nFound {len(game_ids)} Game/Place IDs:")
-            for id in game_ids[:3]:  # Limit to 3 to avoid too many requests
-                self.input_var.set(id)
-                self.scrape_game_info(id)
-            if len(game_ids) > 3:
-                self.append_result(f"...and {len(game_ids) - 3} more game IDs")
-        
-        if user_ids and self.scrape_user.get():
-            self.append_result(f"\nFound {len(user_ids)} User IDs:")
-            for id in user_ids[:3]:  # Limit to 3
-                self.input_var.set(id)
-                self.scrape_user_info(id)
-            if len(user_ids) > 3:
-                self.append_result(f"...and {len(user_ids) - 3} more user IDs")
-        
-        if group_ids and self.scrape_group.get():
-            self.append_result(f"\nFound {len(group_ids)} Group IDs:")
-            for id in group_ids[:3]:  # Limit to 3
-                self.input_var.set(id)
-                self.scrape_group_info(id)
-            if len(group_ids) > 3:
-                self.append_result(f"...and {len(group_ids) - 3} more group IDs")
-        
-        if asset_ids and self.scrape_asset.get():
-            self.append_result(f"\nFound {len(asset_ids)} Asset IDs:")
-            for id in asset_ids[:3]:  # Limit to 3
-                self.input_var.set(id)
-                self.scrape_asset_info(id)
-            if len(asset_ids) > 3:
-                self.append_result(f"...and {len(asset_ids) - 3} more asset IDs")
+        # Process found IDs; lookups for every listed ID run concurrently
+        items = []
+        sections = [
+            (game_ids, self.scrape_game, "Game/Place", "game", self.fetch_game_info, self.render_game_info),
+            (user_ids, self.scrape_user, "User", "user", self.fetch_user_info, self.render_user_info),
+            (group_ids, self.scrape_group, "Group", "group", self.fetch_group_info, self.render_group_info),
+            (asset_ids, self.scrape_asset, "Asset", "asset", self.fetch_asset_info, self.render_asset_info),
+        ]
+        for ids, enabled, label, noun, fetch, render in sections:
+            if ids and enabled.get():
+                items.append(f"\nFound {len(ids)} {label} IDs:")
+                for id in ids[:3]:  # Limit to 3 to avoid too many requests
+                    self.input_var.set(id)
+                    items.append((fetch, render, id))
+                if len(ids) > 3:
+                    items.append(f"...and {len(ids) - 3} more {noun} IDs")
         
         if raw_ids:
-            self.append_result(f"\nFound {len(raw_ids)} raw numeric IDs that might be Roblox IDs")
-            self.append_result("These will need to be manually checked:")
+            items.append(f"\nFound {len(raw_ids)} raw numeric IDs that might be Roblox IDs")
+            items.append("These will need to be manually checked:")
             for id in raw_ids[:10]:  # Limit to 10
-                self.append_result(f"- {id}")
+                items.append(f"- {id}")
             if len(raw_ids) > 10:
-                self.append_result(f"...and {len(raw_ids) - 10} more")
-    
-    def get_asset_type_name(self, type_id):
-        """Convert asset type ID to name"""
-        asset_types = {
-            1: "Image",
-            2: "T-Shirt",
-            3: "Audio",
-            4: "Mesh",
-            5: "Lua",
-            6: "HTML",
-            7: "Text",
-            8: "Hat",
-            9: "Place",
-            10: "Model",
-            11: "Shirt",
-            12: "Pants",
-            13: "Decal",
-            16: "Avatar",
-            17: "Head",
-            18: "Face",
-            19: "Gear",
-            21: "Badge",
-            22: "Group Emblem",
-            24: "Animation",
-            25: "Arms",
-            26: "Legs",
-            27: "Torso",
-            28: "Right Arm",
-            29: "Left Arm",
-            30: "Left Leg",
-            31: "Right Leg",
-            32: "Package",
-            33: "YouTube Video",
-            34: "Game Pass",
-            35: "App",
-            37: "Code",
-            38: "Plugin",
-            39: "SolidModel",
-            40: "MeshPart",
-            41: "Hair Accessory",
-            42: "Face Accessory",
-            43: "Neck Accessory",
-            44: "Shoulder Accessory",
-            45: "Front Accessory",
-            46: "Back Accessory",
-            47: "Waist Accessory",
-            48: "Climb Animation",
-            49: "Death Animation",
-            50: "Fall Animation",
-            51: "Idle Animation",
-            52: "Jump Animation",
-            53: "Run Animation",
-            54: "Swim Animation",
-            55: "Walk Animation",
-            56: "Pose Animation",
-            59: "LocalizationTableManifest",
-            60: "LocalizationTableTranslation",
-            61: "Emote Animation",
-            62: "Video",
-            63: "TexturePack",
-            64: "T-Shirt Accessory",
-            65: "Shirt Accessory",
-            66: "Pants Accessory",
-            67: "Jacket Accessory",
-            68: "Sweater Accessory",
-            69: "Shorts Accessory",
-            70: "Left Shoe Accessory",
-            71: "Right Shoe Accessory",
-            72: "Dress Skirt Accessory"
-        }
-        return asset_types.get(type_id, f"Unknown Type ({type_id})")
+                items.append(f"...and {len(raw_ids) - 10} more")
+        
+        self.queue_scrapes(items)
+
 
 if __name__ == "__main__":
     # Setup the application
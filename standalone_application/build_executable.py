@@ -9,16 +9,53 @@ import sys
 import subprocess
 import platform
 import shutil
+import glob
+from concurrent.futures import ThreadPoolExecutor
+
+# Modules the dependency walker may find but the bot never imports
+EXCLUDED_MODULES = [
+    "tests",
+    "pytest",
+    "tkinter",
+    "matplotlib",
+    "PyQt5",
+    "PyQt6",
+    "PySide2",
+    "PySide6",
+    "IPython",
+    "botocore",
+    "boto3",
+]
+
+MIN_PYTHON = (3, 11)
+
+def subprocess_kwargs():
+    """Extra subprocess arguments so child processes don't each allocate a console on Windows."""
+    if platform.system() != "Windows":
+        return {}
+    
+    # With a console attached the child shares it and keeps its output visible;
+    # only a GUI launcher without one needs CREATE_NO_WINDOW
+    import ctypes
+    if ctypes.windll.kernel32.GetConsoleWindow():
+        return {}
+    return {"creationflags": subprocess.CREATE_NO_WINDOW}
 
 def check_pyinstaller():
     """Check if PyInstaller is available."""
+    # The bundled interpreter is the one running this script; 3.11+ runs the
+    # bot's Python code noticeably faster
+    if sys.version_info < MIN_PYTHON:
+        print(f"❌ Python {MIN_PYTHON[0]}.{MIN_PYTHON[1]}+ is required to build (found {platform.python_version()})")
+        sys.exit(1)
+    
     try:
         import PyInstaller
         print("✓ PyInstaller found")
         return True
     except ImportError:
         print("Installing PyInstaller...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"], **subprocess_kwargs())
         return True
 
 def build_executable():
@@ -27,23 +64,35 @@ def build_executable():
     print(f"🏗️  Building executable for {system}")
     
     # Base command
+    # Reuse the analysis cache in build_cache/ between builds; set
+    # PYINSTALLER_CLEAN=1 to force a full re-analysis
     cmd = [
-        "pyinstaller",
-        "--onefile",
-        "--clean",
+        sys.executable, "-m", "PyInstaller",
+        "--workpath", "build_cache",
         "--name", "AI_Game_Bot",
     ]
+    if os.environ.get("PYINSTALLER_CLEAN") == "1":
+        cmd.append("--clean")
+    
+    # One-folder builds start faster since nothing is unpacked to a temp
+    # dir on every launch; set PYINSTALLER_BUILD_ONEFILE=yes for a single file
+    onefile = os.environ.get("PYINSTALLER_BUILD_ONEFILE") == "yes"
+    cmd.append("--onefile" if onefile else "--onedir")
     
-    # Add data directories
+    # Skip UPX: decompressing binaries on every start costs more than the
+    # disk space it saves
+    cmd.append("--noupx")
+    
+    # Add data directories (core/ and utils/ are picked up through imports)
     data_dirs = [
         ("data", "data"),
         ("static", "static"), 
         ("templates", "templates"),
-        ("core", "core"),
-        ("utils", "utils"),
-        ("attached_assets", "attached_assets")
     ]
     
+    # Only the reference scripts from attached_assets, not caches or stray copies
+    asset_globs = ["*.ahk", "*.js", "*.ts", "*.py", "*.txt"]
+    
     # Platform-specific separators
     separator = ";" if system == "windows" else ":"
     
@@ -51,6 +100,18 @@ def build_executable():
         if os.path.exists(src):
             cmd.extend(["--add-data", f"{src}{separator}{dst}"])
     
+    if os.path.exists("attached_assets"):
+        for pattern in asset_globs:
+            if glob.glob(os.path.join("attached_assets", pattern)):
+                cmd.extend(["--add-data", f"{os.path.join('attached_assets', pattern)}{separator}attached_assets"])
+    
+    # waitress is imported lazily by main.serve_app
+    cmd.extend(["--hidden-import", "waitress"])
+    
+    # Keep test suites and unused GUI/cloud packages out of the bundle
+    for module in EXCLUDED_MODULES:
+        cmd.extend(["--exclude-module", module])
+    
     # Platform-specific options
     if system == "windows":
         cmd.append("--windowed")  # Hide console window
@@ -62,17 +123,19 @@ def build_executable():
     print(f"Command: {' '.join(cmd)}")
     
     try:
-        subprocess.run(cmd, check=True)
+        subprocess.run(cmd, check=True, **subprocess_kwargs())
         print("✓ Build completed successfully!")
         
         # Show output location
         exe_name = "AI_Game_Bot.exe" if system == "windows" else "AI_Game_Bot"
-        exe_path = os.path.join("dist", exe_name)
+        exe_path = os.path.join("dist", exe_name) if onefile else os.path.join("dist", "AI_Game_Bot")
         
-        if os.path.exists(exe_path):
+        if os.path.isfile(exe_path):
             size_mb = os.path.getsize(exe_path) / (1024 * 1024)
             print(f"📦 Executable created: {exe_path}")
             print(f"📏 Size: {size_mb:.1f} MB")
+        elif os.path.isdir(exe_path):
+            print(f"📦 Application folder created: {exe_path}")
         
         # Create distribution package
         create_distribution_package(exe_path)
@@ -91,10 +154,6 @@ def create_distribution_package(exe_path):
     
     os.makedirs(dist_dir)
     
-    # Copy executable
-    if os.path.exists(exe_path):
-        shutil.copy2(exe_path, dist_dir)
-    
     # Copy essential files
     essential_files = [
         "README.md",
@@ -102,9 +161,25 @@ def create_distribution_package(exe_path):
         "requirements.txt"
     ]
     
-    for file in essential_files:
-        if os.path.exists(file):
-            shutil.copy2(file, dist_dir)
+    # A onedir build holds thousands of small files, so copies run in parallel
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        copies = []
+        
+        def copy_async(src, dst):
+            copies.append(executor.submit(shutil.copy2, src, dst))
+        
+        # Copy executable (single file) or application folder (onedir build)
+        if os.path.isdir(exe_path):
+            shutil.copytree(exe_path, os.path.join(dist_dir, "AI_Game_Bot"), copy_function=copy_async)
+        elif os.path.exists(exe_path):
+            copy_async(exe_path, dist_dir)
+        
+        for file in essential_files:
+            if os.path.exists(file):
+                copy_async(file, dist_dir)
+        
+        for copy in copies:
+            copy.result()
     
     # Create sample config file
     config_content = """# AI Game Bot Configuration
@@ -120,44 +195,32 @@ ANTHROPIC_API_KEY=your_anthropic_api_key_here
     with open(os.path.join(dist_dir, "config.env"), "w") as f:
         f.write(config_content)
     
-    # Create startup scripts
-    if platform.system().lower() == "windows":
-        create_windows_startup(dist_dir)
-    else:
-        create_unix_startup(dist_dir)
+    # The executable prints its own banner and starts the web interface when
+    # launched without arguments, so only a dashboard shortcut is needed
+    create_dashboard_shortcut(dist_dir)
     
     print(f"✓ Distribution package created in: {dist_dir}")
+    
+    # Single download for users
+    archive_path = shutil.make_archive(dist_dir, "zip", dist_dir)
+    print(f"✓ Distribution archive created: {archive_path}")
 
-def create_windows_startup(dist_dir):
-    """Create Windows startup script."""
-    bat_content = """@echo off
-echo Starting AI Game Bot...
-echo.
-echo Web interface will be available at: http://localhost:5000
-echo Press Ctrl+C to stop the bot
-echo.
-AI_Game_Bot.exe
-pause
+def create_dashboard_shortcut(dist_dir):
+    """Create a shortcut that opens the web dashboard in the browser."""
+    if platform.system().lower() == "windows":
+        shortcut_path = os.path.join(dist_dir, "AI_Game_Bot_Dashboard.url")
+        content = """[InternetShortcut]
+URL=http://localhost:5000
 """
-    with open(os.path.join(dist_dir, "Start_AI_Game_Bot.bat"), "w") as f:
-        f.write(bat_content)
-
-def create_unix_startup(dist_dir):
-    """Create Unix startup script."""
-    sh_content = """#!/bin/bash
-echo "Starting AI Game Bot..."
-echo ""
-echo "Web interface will be available at: http://localhost:5000"
-echo "Press Ctrl+C to stop the bot"
-echo ""
-./AI_Game_Bot
+    else:
+        shortcut_path = os.path.join(dist_dir, "AI_Game_Bot_Dashboard.desktop")
+        content = """[Desktop Entry]
+Type=Link
+Name=AI Game Bot Dashboard
+URL=http://localhost:5000
 """
-    script_path = os.path.join(dist_dir, "start_ai_game_bot.sh")
-    with open(script_path, "w") as f:
-        f.write(sh_content)
-    
-    # Make executable
-    os.chmod(script_path, 0o755)
+    with open(shortcut_path, "w") as f:
+        f.write(content)
 
 def main():
     """Main build function."""
@@ -169,8 +232,8 @@ def main():
         print("\n🎉 Build process completed!")
         print("\nNext steps:")
         print("1. Navigate to the AI_Game_Bot_Distribution folder")
-        print("2. Run the startup script to launch the bot")
-        print("3. Open http://localhost:5000 in your browser")
+        print("2. Run AI_Game_Bot to launch the bot")
+        print("3. Open http://localhost:5000 (or the dashboard shortcut) in your browser")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,14 +3,15 @@ Automation Engine for Game Control
 Handles mouse and keyboard automation for game interactions
 """
 
+import sys
 import time
 import logging
 from typing import Tuple, List, Optional, Dict, Any
 import threading
-import queue
 import json
 from pathlib import Path
-import random
+from collections import deque
+import numpy as np
 
 try:
     import pyautogui
@@ -19,28 +20,206 @@ except Exception:
     PYAUTOGUI_AVAILABLE = False
     pyautogui = None
 
+# Direct Win32 input injection; each action is packed into one SendInput call
+# instead of going through pyautogui's per-event calls and pauses
+SENDINPUT_AVAILABLE = False
+if sys.platform == 'win32':
+    try:
+        import ctypes
+        from ctypes import wintypes
+        
+        class _MOUSEINPUT(ctypes.Structure):
+            _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG),
+                        ("mouseData", wintypes.DWORD), ("dwFlags", wintypes.DWORD),
+                        ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+        
+        class _KEYBDINPUT(ctypes.Structure):
+            _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD),
+                        ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD),
+                        ("dwExtraInfo", ctypes.c_size_t)]
+        
+        class _HARDWAREINPUT(ctypes.Structure):
+            _fields_ = [("uMsg", wintypes.DWORD), ("wParamL", wintypes.WORD),
+                        ("wParamH", wintypes.WORD)]
+        
+        class _INPUTUNION(ctypes.Union):
+            _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT), ("hi", _HARDWAREINPUT)]
+        
+        class _INPUT(ctypes.Structure):
+            _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+        
+        _user32 = ctypes.windll.user32
+        _user32.SendInput.argtypes = (wintypes.UINT, ctypes.POINTER(_INPUT), ctypes.c_int)
+        _user32.SendInput.restype = wintypes.UINT
+        SENDINPUT_AVAILABLE = True
+    except Exception:
+        SENDINPUT_AVAILABLE = False
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+MOUSEEVENTF_MOVE = 0x0001
+MOUSEEVENTF_ABSOLUTE = 0x8000
+KEYEVENTF_KEYUP = 0x0002
+
+# (down, up) flags per mouse button
+MOUSE_BUTTON_FLAGS = {
+    'left': (0x0002, 0x0004),
+    'right': (0x0008, 0x0010),
+    'middle': (0x0020, 0x0040)
+}
+
+# Virtual-key codes for named keys; letters and digits map to their own
+# uppercase code point, anything else goes through pyautogui
+VK_CODES = {
+    'backspace': 0x08, 'tab': 0x09, 'enter': 0x0D, 'return': 0x0D,
+    'shift': 0x10, 'ctrl': 0x11, 'alt': 0x12, 'esc': 0x1B, 'escape': 0x1B,
+    'space': 0x20, ' ': 0x20, 'left': 0x25, 'up': 0x26, 'right': 0x27,
+    'down': 0x28, 'delete': 0x2E,
+    **{f'f{i}': 0x6F + i for i in range(1, 13)}
+}
+
+# Numba is optional; without it these kernels fall back to NumPy
+try:
+    from numba import njit
+    
+    @njit(cache=True)
+    def _centroid(points):
+        """Centroid of an (N, 2) float point array"""
+        sum_x = 0.0
+        sum_y = 0.0
+        n = points.shape[0]
+        for i in range(n):
+            sum_x += points[i, 0]
+            sum_y += points[i, 1]
+        return sum_x / n, sum_y / n
+    
+    @njit(cache=True)
+    def _point_in_regions(x, y, regions):
+        """Check if (x, y) lies in any row of an (N, 4) [x0, y0, x1, y1] array"""
+        for i in range(regions.shape[0]):
+            if regions[i, 0] <= x <= regions[i, 2] and regions[i, 1] <= y <= regions[i, 3]:
+                return True
+        return False
+    
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+    
+    def _centroid(points):
+        """Centroid of an (N, 2) float point array"""
+        center = points.mean(axis=0)
+        return center[0], center[1]
+    
+    def _point_in_regions(x, y, regions):
+        """Check if (x, y) lies in any row of an (N, 4) [x0, y0, x1, y1] array"""
+        return bool(((regions[:, 0] <= x) & (x <= regions[:, 2]) &
+                     (regions[:, 1] <= y) & (y <= regions[:, 3])).any())
+
+def _bezier_path(x0: int, y0: int, x1: int, y1: int, rng: np.random.Generator, n: int = 8) -> np.ndarray:
+    """Integer waypoints along a quadratic Bezier curve, excluding the start
+    
+    The control point is the midpoint jittered by up to 10 pixels, and the
+    last waypoint is always exactly (x1, y1).
+    """
+    start = np.array([x0, y0], dtype=np.float64)
+    end = np.array([x1, y1], dtype=np.float64)
+    control = (start + end) / 2 + rng.integers(-10, 11, size=2)
+    t = np.linspace(0.0, 1.0, n + 1)[1:, None]
+    points = (1 - t) ** 2 * start + 2 * (1 - t) * t * control + t ** 2 * end
+    return np.rint(points).astype(np.int32)
+
+# Queued actions are plain tuples tagged with one of these types:
+#   (ACTION_CLICK, x, y, button, clicks)
+#   (ACTION_MOVE, x, y)
+#   (ACTION_DRAG, from_x, from_y, to_x, to_y, button)
+#   (ACTION_KEY, key, action)
+#   (ACTION_SCROLL, scrolls, x, y)
+#   (ACTION_WAIT, duration)
+ACTION_CLICK = 0
+ACTION_MOVE = 1
+ACTION_DRAG = 2
+ACTION_KEY = 3
+ACTION_SCROLL = 4
+ACTION_WAIT = 5
+
+Action = Tuple[Any, ...]
+
+# Pre-drawn click jitter values; a power of two so the index can wrap with a mask
+JITTER_BUFFER_SIZE = 4096
+
+# Moves between re-reading the real cursor position from the OS
+CURSOR_RESYNC_INTERVAL = 32
+
+# Below this many regions a plain loop is faster than a NumPy comparison
+REGION_ARRAY_THRESHOLD = 8
+
+def _virtual_key(key: str) -> Optional[int]:
+    """Get the virtual-key code for a key name, or None if unmapped"""
+    if len(key) == 1 and key.isascii() and key.isalnum():
+        return ord(key.upper())
+    return VK_CODES.get(key.lower())
+
+def _send_inputs(inputs: List[Any]):
+    """Inject a batch of INPUT structures with a single SendInput call"""
+    count = len(inputs)
+    _user32.SendInput(count, (_INPUT * count)(*inputs), ctypes.sizeof(_INPUT))
+
 class AutomationEngine:
     """Main automation engine for game control"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._is_active = False
-        self.action_queue = queue.Queue()
+        # Single producer, single consumer: deque append/popleft are atomic,
+        # so no lock is needed around the queue
+        self.action_queue = deque()
+        self._wake = threading.Event()  # Set when actions are queued
+        self._abort = threading.Event()  # Set to cut short a running wait
         self.worker_thread = None
         
-        # Configure PyAutoGUI
+        # Per-action debug messages are only formatted when DEBUG is enabled;
+        # refreshed whenever the worker wakes
+        self._debug = self.logger.isEnabledFor(logging.DEBUG)
+        
+        # Configure PyAutoGUI. Pacing comes from queued wait actions, so the
+        # engine's own calls pass _pause=False rather than zeroing the global
+        # PAUSE that direct pyautogui users (macro playback) rely on
         if PYAUTOGUI_AVAILABLE:
             pyautogui.FAILSAFE = False
-            pyautogui.PAUSE = 0.1  # Small pause between actions
+        
+        # Use SendInput where available, pyautogui otherwise
+        self.use_sendinput = SENDINPUT_AVAILABLE
+        if SENDINPUT_AVAILABLE:
+            self._screen_size = (_user32.GetSystemMetrics(0), _user32.GetSystemMetrics(1))
         
         # Movement settings
         self.move_duration = 0.3
         self.click_duration = 0.1
         self.human_like_movement = True
         
+        # Private RNG, and a buffer of pre-drawn -2..2 click jitter values
+        self._rng = np.random.default_rng()
+        self._jitter = self._rng.integers(-2, 3, size=JITTER_BUFFER_SIZE).tolist()
+        self._jitter_index = 0
+        
+        # Last commanded cursor position, or None to read it from the OS
+        self._cursor = None
+        self._moves_since_sync = 0
+        
         # Safety settings
         self.safe_regions = []  # Regions where clicks are safe
         self.forbidden_regions = []  # Regions to avoid
+        self._rebuild_region_bounds()
+        
+        # Action handlers, indexed by action type
+        self._dispatch = [
+            self._execute_click,
+            self._execute_move,
+            self._execute_drag,
+            self._execute_key,
+            self._execute_scroll,
+            self._execute_wait
+        ]
         
         self.logger.info("Automation engine initialized")
     
@@ -60,12 +239,11 @@ class AutomationEngine:
         """Stop the automation engine"""
         self._is_active = False
         
-        # Clear pending actions
-        while not self.action_queue.empty():
-            try:
-                self.action_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Clear pending actions, abort any running wait and wake the worker
+        # so it can exit
+        self.action_queue.clear()
+        self._abort.set()
+        self._wake.set()
         
         # Wait for worker thread to finish
         if self.worker_thread:
@@ -75,51 +253,76 @@ class AutomationEngine:
     
     def _worker_loop(self):
         """Main worker loop for processing automation actions"""
+        wake = self._wake
+        abort = self._abort
+        next_action = self._next_action
+        execute_action = self._execute_action
+        
         while self._is_active:
-            try:
-                # Get next action from queue (timeout to allow periodic checks)
-                action = self.action_queue.get(timeout=1.0)
-                
-                # Process the action
-                self._execute_action(action)
+            # Sleep until actions are queued (or the engine stops), then drain
+            wake.wait()
+            wake.clear()
+            abort.clear()
+            self._debug = self.logger.isEnabledFor(logging.DEBUG)
+            
+            while self._is_active:
+                try:
+                    action = next_action()
+                except IndexError:
+                    break
                 
-                # Mark task as done
-                self.action_queue.task_done()
+                try:
+                    execute_action(action)
+                except Exception as e:
+                    self.logger.error("Action execution failed: %s", e)
                 
-            except queue.Empty:
-                continue
-            except Exception as e:
-                self.logger.error(f"Action execution failed: {e}")
+                # The queue was cleared mid-action; carry on with whatever
+                # has been queued since
+                if abort.is_set():
+                    abort.clear()
+    
+    def _next_action(self) -> Action:
+        """Pop the next action, coalescing it with the actions queued behind it
+        
+        Consecutive waits become one wait, and a move straight before a click
+        at the same position is dropped since the click moves there anyway.
+        Raises IndexError when the queue is empty.
+        """
+        action_queue = self.action_queue
+        action = action_queue.popleft()
+        action_type = action[0]
+        
+        if action_type == ACTION_WAIT:
+            if action_queue and action_queue[0][0] == ACTION_WAIT:
+                duration = action[1]
+                while action_queue and action_queue[0][0] == ACTION_WAIT:
+                    duration += action_queue.popleft()[1]
+                action = (ACTION_WAIT, duration)
+        elif action_type == ACTION_MOVE and action_queue:
+            next_action = action_queue[0]
+            if (next_action[0] == ACTION_CLICK and
+                    next_action[1] == action[1] and
+                    next_action[2] == action[2]):
+                action = action_queue.popleft()
+        
+        return action
     
-    def _execute_action(self, action: Dict[str, Any]):
+    def _execute_action(self, action: Action):
         """Execute a single automation action"""
         try:
-            action_type = action.get('type')
+            action_type = action[0]
             
-            if action_type == 'click':
-                self._execute_click(action)
-            elif action_type == 'move':
-                self._execute_move(action)
-            elif action_type == 'drag':
-                self._execute_drag(action)
-            elif action_type == 'key':
-                self._execute_key(action)
-            elif action_type == 'scroll':
-                self._execute_scroll(action)
-            elif action_type == 'wait':
-                self._execute_wait(action)
+            if 0 <= action_type < len(self._dispatch):
+                self._dispatch[action_type](action)
             else:
                 self.logger.warning(f"Unknown action type: {action_type}")
                 
         except Exception as e:
-            self.logger.error(f"Failed to execute action {action}: {e}")
+            self.logger.error("Failed to execute action %s: %s", action, e)
     
-    def _execute_click(self, action: Dict[str, Any]):
+    def _execute_click(self, action: Action):
         """Execute a click action"""
-        x = action.get('x', 0)
-        y = action.get('y', 0)
-        button = action.get('button', 'left')
-        clicks = action.get('clicks', 1)
+        _, x, y, button, clicks = action
         
         if not self._is_safe_position(x, y):
             self.logger.warning(f"Unsafe click position: ({x}, {y})")
@@ -127,183 +330,270 @@ class AutomationEngine:
         
         # Add human-like randomness
         if self.human_like_movement:
-            x += random.randint(-2, 2)
-            y += random.randint(-2, 2)
-        
-        # Move to position first
-        self._move_to_position(x, y)
-        
-        # Perform click
-        if PYAUTOGUI_AVAILABLE:
-            pyautogui.click(x, y, clicks=clicks, button=button, duration=self.click_duration)
+            x += self._next_jitter()
+            y += self._next_jitter()
+        
+        if self.use_sendinput:
+            # Move, then press and release, in one batch
+            down, up = MOUSE_BUTTON_FLAGS.get(button, MOUSE_BUTTON_FLAGS['left'])
+            inputs = self._move_inputs(x, y)
+            for _ in range(clicks):
+                inputs.append(self._mouse_input(down))
+                inputs.append(self._mouse_input(up))
+            _send_inputs(inputs)
+        elif PYAUTOGUI_AVAILABLE:
+            # Move to position first; click without coordinates so pyautogui
+            # doesn't move a second time
+            self._move_to_position(x, y)
+            pyautogui.click(clicks=clicks, button=button, _pause=False)
         else:
             self.logger.info(f"Demo mode: Would click at ({x}, {y})")
         
-        self.logger.debug(f"Clicked at ({x}, {y}) with {button} button")
+        if self._debug:
+            self.logger.debug(f"Clicked at ({x}, {y}) with {button} button")
     
-    def _execute_move(self, action: Dict[str, Any]):
+    def _execute_move(self, action: Action):
         """Execute a move action"""
-        x = action.get('x', 0)
-        y = action.get('y', 0)
+        _, x, y = action
         
-        if PYAUTOGUI_AVAILABLE:
-            self._move_to_position(x, y)
-        self.logger.debug(f"Moved to ({x}, {y})")
+        self._move_to_position(x, y)
+        if self._debug:
+            self.logger.debug(f"Moved to ({x}, {y})")
     
-    def _execute_drag(self, action: Dict[str, Any]):
+    def _execute_drag(self, action: Action):
         """Execute a drag action"""
-        from_x = action.get('from_x', 0)
-        from_y = action.get('from_y', 0)
-        to_x = action.get('to_x', 0)
-        to_y = action.get('to_y', 0)
-        button = action.get('button', 'left')
+        _, from_x, from_y, to_x, to_y, button = action
         
         if not (self._is_safe_position(from_x, from_y) and self._is_safe_position(to_x, to_y)):
             self.logger.warning(f"Unsafe drag positions: ({from_x}, {from_y}) to ({to_x}, {to_y})")
             return
         
-        if PYAUTOGUI_AVAILABLE:
+        if self.use_sendinput:
+            down, up = MOUSE_BUTTON_FLAGS.get(button, MOUSE_BUTTON_FLAGS['left'])
+            inputs = self._move_inputs(from_x, from_y)
+            inputs.append(self._mouse_input(down))
+            inputs.append(self._mouse_input(MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE, to_x, to_y))
+            inputs.append(self._mouse_input(up))
+            _send_inputs(inputs)
+            self._cursor = (to_x, to_y)
+        elif PYAUTOGUI_AVAILABLE:
             pyautogui.drag(to_x - from_x, to_y - from_y, 
-                          duration=self.move_duration, button=button)
+                          duration=self.move_duration, button=button, _pause=False)
+            self._cursor = None
         else:
             self.logger.info(f"Demo mode: Would drag from ({from_x}, {from_y}) to ({to_x}, {to_y})")
         
-        self.logger.debug(f"Dragged from ({from_x}, {from_y}) to ({to_x}, {to_y})")
+        if self._debug:
+            self.logger.debug(f"Dragged from ({from_x}, {from_y}) to ({to_x}, {to_y})")
     
-    def _execute_key(self, action: Dict[str, Any]):
+    def _execute_key(self, action: Action):
         """Execute a keyboard action"""
-        key = action.get('key', '')
-        action_type = action.get('action', 'press')  # press, hold, release
+        _, key, action_type = action  # action_type: press, hold, release
+        
+        vk = _virtual_key(key) if self.use_sendinput else None
+        if vk is not None:
+            if action_type == 'press':
+                _send_inputs([self._key_input(vk), self._key_input(vk, KEYEVENTF_KEYUP)])
+            elif action_type == 'hold':
+                _send_inputs([self._key_input(vk)])
+            elif action_type == 'release':
+                _send_inputs([self._key_input(vk, KEYEVENTF_KEYUP)])
+            if self._debug:
+                self.logger.debug(f"Key action: {action_type} {key}")
+            return
         
         if not PYAUTOGUI_AVAILABLE:
             self.logger.info(f"Demo mode: Would press key {key}")
             return
             
         if action_type == 'press':
-            pyautogui.press(key)
+            pyautogui.press(key, _pause=False)
         elif action_type == 'hold':
-            pyautogui.keyDown(key)
+            pyautogui.keyDown(key, _pause=False)
         elif action_type == 'release':
-            pyautogui.keyUp(key)
+            pyautogui.keyUp(key, _pause=False)
         
-        self.logger.debug(f"Key action: {action_type} {key}")
+        if self._debug:
+            self.logger.debug(f"Key action: {action_type} {key}")
     
-    def _execute_scroll(self, action: Dict[str, Any]):
+    def _execute_scroll(self, action: Action):
         """Execute a scroll action"""
-        x = action.get('x', None)
-        y = action.get('y', None)
-        scrolls = action.get('scrolls', 1)
+        _, scrolls, x, y = action
         
         if not PYAUTOGUI_AVAILABLE:
             self.logger.info(f"Demo mode: Would scroll {scrolls}")
             return
             
         if x is not None and y is not None:
-            pyautogui.scroll(scrolls, x=x, y=y)
+            pyautogui.scroll(scrolls, x=x, y=y, _pause=False)
+            self._cursor = None
         else:
-            pyautogui.scroll(scrolls)
+            pyautogui.scroll(scrolls, _pause=False)
         
-        self.logger.debug(f"Scrolled {scrolls} at ({x}, {y})")
+        if self._debug:
+            self.logger.debug(f"Scrolled {scrolls} at ({x}, {y})")
     
-    def _execute_wait(self, action: Dict[str, Any]):
+    def _execute_wait(self, action: Action):
         """Execute a wait action"""
-        duration = action.get('duration', 1.0)
-        time.sleep(duration)
-        self.logger.debug(f"Waited {duration} seconds")
+        duration = action[1]
+        
+        # Interruptible sleep, so clearing the queue or an emergency stop
+        # doesn't have to wait it out
+        if self._abort.wait(duration):
+            if self._debug:
+                self.logger.debug(f"Wait of {duration} seconds aborted")
+            return
+        
+        if self._debug:
+            self.logger.debug(f"Waited {duration} seconds")
+    
+    def _mouse_input(self, flags: int, x: int = 0, y: int = 0, data: int = 0):
+        """Build a mouse INPUT; absolute coordinates are scaled to 0-65535"""
+        if flags & MOUSEEVENTF_ABSOLUTE:
+            width, height = self._screen_size
+            x = x * 65535 // max(width - 1, 1)
+            y = y * 65535 // max(height - 1, 1)
+        return _INPUT(INPUT_MOUSE, _INPUTUNION(mi=_MOUSEINPUT(x, y, data, flags, 0, 0)))
+    
+    def _key_input(self, vk: int, flags: int = 0):
+        """Build a keyboard INPUT for a virtual-key code"""
+        return _INPUT(INPUT_KEYBOARD, _INPUTUNION(ki=_KEYBDINPUT(vk, 0, flags, 0, 0)))
+    
+    def _move_inputs(self, x: int, y: int) -> List[Any]:
+        """Build the mouse INPUTs that move the cursor to a position"""
+        flags = MOUSEEVENTF_MOVE | MOUSEEVENTF_ABSOLUTE
+        if self.human_like_movement:
+            # Follow a slightly curved path
+            current_x, current_y = self._cursor_position()
+            path = _bezier_path(current_x, current_y, x, y, self._rng)
+            inputs = [self._mouse_input(flags, px, py) for px, py in path.tolist()]
+        else:
+            inputs = [self._mouse_input(flags, x, y)]
+        self._cursor = (x, y)
+        return inputs
+    
+    def _next_jitter(self) -> int:
+        """Take the next pre-drawn click jitter value, refilling the buffer when it wraps"""
+        index = self._jitter_index
+        value = self._jitter[index]
+        index = (index + 1) & (JITTER_BUFFER_SIZE - 1)
+        if index == 0:
+            self._jitter = self._rng.integers(-2, 3, size=JITTER_BUFFER_SIZE).tolist()
+        self._jitter_index = index
+        return value
+    
+    def _cursor_position(self) -> Tuple[int, int]:
+        """Get the cursor position, re-read from the OS only every few moves"""
+        if self._cursor is None or self._moves_since_sync >= CURSOR_RESYNC_INTERVAL:
+            if self.use_sendinput:
+                point = wintypes.POINT()
+                _user32.GetCursorPos(ctypes.byref(point))
+                self._cursor = (point.x, point.y)
+            else:
+                self._cursor = tuple(pyautogui.position())
+            self._moves_since_sync = 0
+        
+        self._moves_since_sync += 1
+        return self._cursor
     
     def _move_to_position(self, x: int, y: int):
         """Move mouse to position with human-like movement"""
+        if self.use_sendinput:
+            _send_inputs(self._move_inputs(x, y))
+            return
+        
         if not PYAUTOGUI_AVAILABLE:
             return
             
         if self.human_like_movement:
             # Add slight curve to movement
-            current_x, current_y = pyautogui.position()
-            mid_x = (current_x + x) // 2 + random.randint(-10, 10)
-            mid_y = (current_y + y) // 2 + random.randint(-10, 10)
+            current_x, current_y = self._cursor_position()
+            offset_x, offset_y = self._rng.integers(-10, 11, size=2).tolist()
+            mid_x = (current_x + x) // 2 + offset_x
+            mid_y = (current_y + y) // 2 + offset_y
             
             # Move in two steps for more natural movement
-            pyautogui.moveTo(mid_x, mid_y, duration=self.move_duration / 2)
-            pyautogui.moveTo(x, y, duration=self.move_duration / 2)
+            pyautogui.moveTo(mid_x, mid_y, duration=self.move_duration / 2, _pause=False)
+            pyautogui.moveTo(x, y, duration=self.move_duration / 2, _pause=False)
         else:
-            pyautogui.moveTo(x, y, duration=self.move_duration)
+            pyautogui.moveTo(x, y, duration=self.move_duration, _pause=False)
+        self._cursor = (x, y)
     
     def _is_safe_position(self, x: int, y: int) -> bool:
         """Check if position is safe for automation"""
         # Check forbidden regions
-        for region in self.forbidden_regions:
-            if (region['x'] <= x <= region['x'] + region['width'] and
-                region['y'] <= y <= region['y'] + region['height']):
-                return False
+        if self._forbidden_bounds and self._in_any_region(self._forbidden_bounds, self._forbidden_arr, x, y):
+            return False
         
         # If safe regions are defined, position must be in one of them
-        if self.safe_regions:
-            for region in self.safe_regions:
-                if (region['x'] <= x <= region['x'] + region['width'] and
-                    region['y'] <= y <= region['y'] + region['height']):
-                    return True
-            return False
+        if self._safe_bounds:
+            return self._in_any_region(self._safe_bounds, self._safe_arr, x, y)
         
         # No restrictions if no safe regions defined
         return True
     
+    @staticmethod
+    def _in_any_region(bounds: Tuple[Tuple[int, int, int, int], ...], arr: np.ndarray, x: int, y: int) -> bool:
+        """Check if a point lies in any region, given as (x0, y0, x1, y1) bounds"""
+        if len(bounds) < REGION_ARRAY_THRESHOLD:
+            for x0, y0, x1, y1 in bounds:
+                if x0 <= x <= x1 and y0 <= y <= y1:
+                    return True
+            return False
+        
+        return _point_in_regions(x, y, arr)
+    
+    def _rebuild_region_bounds(self):
+        """Precompute region bounds as tuples and (N, 4) int32 arrays"""
+        def bounds(regions):
+            return tuple((r['x'], r['y'], r['x'] + r['width'], r['y'] + r['height']) for r in regions)
+        
+        self._safe_bounds = bounds(self.safe_regions)
+        self._forbidden_bounds = bounds(self.forbidden_regions)
+        self._safe_arr = np.array(self._safe_bounds, dtype=np.int32).reshape(-1, 4)
+        self._forbidden_arr = np.array(self._forbidden_bounds, dtype=np.int32).reshape(-1, 4)
+    
+    def _enqueue(self, action: Action):
+        """Add an action to the queue and wake the worker"""
+        self.action_queue.append(action)
+        self._wake.set()
+    
+    def _extend(self, actions: List[Action]):
+        """Add a batch of actions to the queue and wake the worker once"""
+        self.action_queue.extend(actions)
+        self._wake.set()
+    
     def queue_click(self, x: int, y: int, button: str = 'left', clicks: int = 1):
         """Queue a click action"""
-        action = {
-            'type': 'click',
-            'x': x,
-            'y': y,
-            'button': button,
-            'clicks': clicks
-        }
-        self.action_queue.put(action)
+        self._enqueue((ACTION_CLICK, x, y, button, clicks))
     
     def queue_move(self, x: int, y: int):
         """Queue a move action"""
-        action = {
-            'type': 'move',
-            'x': x,
-            'y': y
-        }
-        self.action_queue.put(action)
+        self._enqueue((ACTION_MOVE, x, y))
     
     def queue_drag(self, from_x: int, from_y: int, to_x: int, to_y: int, button: str = 'left'):
         """Queue a drag action"""
-        action = {
-            'type': 'drag',
-            'from_x': from_x,
-            'from_y': from_y,
-            'to_x': to_x,
-            'to_y': to_y,
-            'button': button
-        }
-        self.action_queue.put(action)
+        self._enqueue((ACTION_DRAG, from_x, from_y, to_x, to_y, button))
     
     def queue_key(self, key: str, action_type: str = 'press'):
         """Queue a keyboard action"""
-        action = {
-            'type': 'key',
-            'key': key,
-            'action': action_type
-        }
-        self.action_queue.put(action)
+        self._enqueue((ACTION_KEY, key, action_type))
     
     def queue_wait(self, duration: float):
         """Queue a wait action"""
-        action = {
-            'type': 'wait',
-            'duration': duration
-        }
-        self.action_queue.put(action)
+        self._enqueue((ACTION_WAIT, duration))
     
     def click_at_positions(self, positions: List[Tuple[int, int]], delay: float = 0.5):
         """Click at multiple positions with delay between clicks"""
-        for i, (x, y) in enumerate(positions):
-            self.queue_click(x, y)
-            
-            # Add delay between clicks (except after the last one)
-            if i < len(positions) - 1:
-                self.queue_wait(delay)
+        actions = []
+        for x, y in positions:
+            actions.append((ACTION_CLICK, x, y, 'left', 1))
+            actions.append((ACTION_WAIT, delay))
+        
+        # Add delay between clicks (except after the last one)
+        if actions:
+            actions.pop()
+        self._extend(actions)
     
     def open_chests(self, chest_positions: List[Tuple[int, int]]) -> str:
         """Automate opening chests at given positions"""
@@ -312,18 +602,22 @@ class AutomationEngine:
         
         self.logger.info(f"Opening {len(chest_positions)} chests")
         
+        actions = []
         for i, position in enumerate(chest_positions):
             x, y = position[:2]
-            confidence = getattr(position, '__getitem__', lambda i: 1.0)(2) if len(position) > 2 else 1.0
-            self.logger.debug(f"Opening chest {i+1} at ({x}, {y}) with confidence {confidence}")
+            if self._debug:
+                confidence = position[2] if len(position) > 2 else 1.0
+                self.logger.debug(f"Opening chest {i+1} at ({x}, {y}) with confidence {confidence}")
             
-            # Move to chest position
-            self.queue_move(x, y)
-            self.queue_wait(0.2)
-            
-            # Double-click to open chest
-            self.queue_click(x, y, clicks=2)
-            self.queue_wait(0.8)  # Wait for chest animation
+            actions.extend((
+                # Move to chest position
+                (ACTION_MOVE, x, y),
+                (ACTION_WAIT, 0.2),
+                # Double-click to open chest
+                (ACTION_CLICK, x, y, 'left', 2),
+                (ACTION_WAIT, 0.8)  # Wait for chest animation
+            ))
+        self._extend(actions)
         
         return f"Queued actions to open {len(chest_positions)} chests"
     
@@ -334,22 +628,25 @@ class AutomationEngine:
         
         self.logger.info(f"Hatching {len(egg_positions)} eggs")
         
+        actions = []
         for i, position in enumerate(egg_positions):
             x, y = position[:2]
-            confidence = getattr(position, '__getitem__', lambda i: 1.0)(2) if len(position) > 2 else 1.0
-            self.logger.debug(f"Hatching egg {i+1} at ({x}, {y}) with confidence {confidence}")
-            
-            # Move to egg position
-            self.queue_move(x, y)
-            self.queue_wait(0.2)
+            if self._debug:
+                confidence = position[2] if len(position) > 2 else 1.0
+                self.logger.debug(f"Hatching egg {i+1} at ({x}, {y}) with confidence {confidence}")
             
-            # Click to select egg
-            self.queue_click(x, y)
-            self.queue_wait(0.5)
-            
-            # Press hatch key (assuming 'h' key hatches eggs)
-            self.queue_key('h')
-            self.queue_wait(1.0)  # Wait for hatching animation
+            actions.extend((
+                # Move to egg position
+                (ACTION_MOVE, x, y),
+                (ACTION_WAIT, 0.2),
+                # Click to select egg
+                (ACTION_CLICK, x, y, 'left', 1),
+                (ACTION_WAIT, 0.5),
+                # Press hatch key (assuming 'h' key hatches eggs)
+                (ACTION_KEY, 'h', 'press'),
+                (ACTION_WAIT, 1.0)  # Wait for hatching animation
+            ))
+        self._extend(actions)
         
         return f"Queued actions to hatch {len(egg_positions)} eggs"
     
@@ -362,9 +659,8 @@ class AutomationEngine:
         
         self.logger.info(f"Moving to area at ({x}, {y})")
         
-        # Move to target area
-        self.queue_move(x, y)
-        self.queue_click(x, y)  # Click to move character
+        # Move to target area, then click to move character
+        self._extend([(ACTION_MOVE, x, y), (ACTION_CLICK, x, y, 'left', 1)])
         
         return f"Moving to area at ({x}, {y})"
     
@@ -377,11 +673,10 @@ class AutomationEngine:
         if len(breakables_positions) == 1:
             center_x, center_y = breakables_positions[0][:2]
         else:
-            # Calculate center of all breakables
-            x_coords = [pos[0] for pos in breakables_positions]
-            y_coords = [pos[1] for pos in breakables_positions]
-            center_x = sum(x_coords) // len(x_coords)
-            center_y = sum(y_coords) // len(y_coords)
+            # Calculate center of all breakables; positions may carry a
+            # trailing confidence, and only the final center is rounded
+            points = np.array([position[:2] for position in breakables_positions], dtype=np.float64)
+            center_x, center_y = (int(round(c)) for c in _centroid(points))
         
         # Move to center of breakables area
         result = self.move_to_area((center_x, center_y))
@@ -398,21 +693,18 @@ class AutomationEngine:
         try:
             if PYAUTOGUI_AVAILABLE:
                 pyautogui.moveTo(0, 0, duration=0.5)
+                self._cursor = (0, 0)
         except:
             pass
     
     def get_queue_size(self) -> int:
-        """Get current action queue size"""
-        return self.action_queue.qsize()
+        """Get current action queue size (lock-free; deque length is O(1))"""
+        return len(self.action_queue)
     
     def clear_queue(self):
         """Clear all pending actions"""
-        while not self.action_queue.empty():
-            try:
-                self.action_queue.get_nowait()
-            except queue.Empty:
-                break
-        
+        self.action_queue.clear()
+        self._abort.set()
         self.logger.info("Action queue cleared")
     
     def is_active(self) -> bool:
@@ -428,6 +720,7 @@ class AutomationEngine:
             'height': height
         }
         self.safe_regions.append(region)
+        self._rebuild_region_bounds()
         self.logger.info(f"Added safe region: {region}")
     
     def set_forbidden_region(self, x: int, y: int, width: int, height: int):
@@ -439,10 +732,12 @@ class AutomationEngine:
             'height': height
         }
         self.forbidden_regions.append(region)
+        self._rebuild_region_bounds()
         self.logger.info(f"Added forbidden region: {region}")
     
     def clear_regions(self):
         """Clear all safe and forbidden regions"""
         self.safe_regions.clear()
         self.forbidden_regions.clear()
+        self._rebuild_region_bounds()
         self.logger.info("Cleared all regions")
@@ -8,26 +8,219 @@ import logging
 import time
 import threading
 import json
-import pickle
+import struct
+import hashlib
+import functools
+import queue
+import heapq
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-from collections import deque, defaultdict
-import random
+from collections import deque
 import psycopg2
 import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Initial Q-table capacity; each axis doubles as new states/actions appear
+INITIAL_Q_STATES = 64
+INITIAL_Q_ACTIONS = 16
+
+# Unvisited Q-values start above typical rewards so greedy selection still
+# tries every action before settling
+OPTIMISTIC_INIT = 1.2
+
+# Core purpose protection - actions containing these must always be prioritized
+CORE_ACTIONS = ("open_chests", "hatch_eggs", "stay_in_breakables", "farm", "macro")
+
+# Experiences kept for pattern analysis (oldest are overwritten)
+EXPERIENCE_CAPACITY = 5000
+
+# Experiences are handed to the learning thread in batches of this size,
+# or sooner once the oldest unsent one is this many seconds old
+HANDOFF_BATCH_SIZE = 64
+HANDOFF_MAX_DELAY = 1.0
+
+# Uniform draws generated per refill for exploration decisions (power of two)
+RANDOM_BUFFER_SIZE = 4096
+
+# Repository knowledge query, prepared once per database session
+PATTERN_QUERY = """
+    PREPARE p_patterns(text[], real, int) AS
+    SELECT pattern_type, pattern_name, code_snippet, relevance_score
+    FROM code_patterns
+    WHERE pattern_type = ANY($1)
+    AND relevance_score > $2
+    ORDER BY relevance_score DESC
+    LIMIT $3
+"""
+RELEVANT_PATTERN_TYPES = ['computer_vision', 'input_automation', 'macro_system']
+
+# Base reward per outcome class (see _classify_outcome)
+OUTCOME_REWARDS = (0.0, 1.0, 0.5, -0.3)
+
+# Actions mentioning these earn the core purpose alignment bonus
+REWARDED_ACTION_KEYWORDS = ("chest", "egg", "breakable", "farm", "macro")
+
+@functools.lru_cache(maxsize=1024)
+def _classify_outcome(outcome: str) -> int:
+    """Classify an outcome string: 1 success, 2 partial, 3 failure, 0 other"""
+    outcome = outcome.lower()
+    if "success" in outcome or "completed" in outcome or "found" in outcome:
+        return 1
+    if "partial" in outcome or "progress" in outcome:
+        return 2
+    if "failed" in outcome or "error" in outcome:
+        return 3
+    return 0
+
+@functools.lru_cache(maxsize=1024)
+def _action_is_core(action: str) -> bool:
+    """Whether an action earns the core purpose alignment bonus"""
+    action = action.lower()
+    return any(core in action for core in REWARDED_ACTION_KEYWORDS)
+
+def _dumps_bytes(data) -> bytes:
+    """Serialize data to compact JSON bytes with orjson when available"""
+    if not ORJSON_AVAILABLE:
+        return json.dumps(data).encode('utf-8')
+    return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _loads_bytes(data: bytes):
+    """Parse JSON bytes with orjson when available"""
+    if not ORJSON_AVAILABLE:
+        return json.loads(data)
+    return orjson.loads(data)
+
+# Numba is optional; without it pattern mining and Q updates fall back to NumPy
+try:
+    from numba import njit
+    
+    @njit(cache=True)
+    def _mine_patterns(rewards, regions, timestamps):
+        """Scan an experience window for pattern events
+        
+        Returns start indices of three-step runs with every reward above 0.5,
+        per-region experience counts and reward sums, and indices i where the
+        step to i + 1 took 1-5 seconds and earned a reward above 0.7.
+        """
+        n = rewards.shape[0]
+        
+        sequence_starts = np.empty(max(n - 2, 0), dtype=np.int64)
+        n_sequences = 0
+        for i in range(n - 2):
+            if rewards[i] > 0.5 and rewards[i + 1] > 0.5 and rewards[i + 2] > 0.5:
+                sequence_starts[n_sequences] = i
+                n_sequences += 1
+        
+        n_regions = 0
+        for i in range(n):
+            if regions[i] >= n_regions:
+                n_regions = regions[i] + 1
+        region_counts = np.zeros(n_regions, dtype=np.int64)
+        region_sums = np.zeros(n_regions, dtype=np.float64)
+        for i in range(n):
+            region_counts[regions[i]] += 1
+            region_sums[regions[i]] += rewards[i]
+        
+        timing_hits = np.empty(max(n - 1, 0), dtype=np.int64)
+        n_timing = 0
+        for i in range(n - 1):
+            time_diff = timestamps[i + 1] - timestamps[i]
+            if 1.0 < time_diff < 5.0 and rewards[i + 1] > 0.7:
+                timing_hits[n_timing] = i
+                n_timing += 1
+        
+        return sequence_starts[:n_sequences], region_counts, region_sums, timing_hits[:n_timing]
+    
+    @njit(cache=True)
+    def _q_update_batch(q, state_ids, action_ids, rewards, next_state_ids, n_actions, alpha, gamma):
+        """Apply Bellman backups r + γ·max_a' Q(s', a') to q in place
+        
+        Every delta is taken against the Q-values from before the batch, so
+        repeated (s, a) pairs accumulate exactly as with np.add.at.
+        """
+        n = state_ids.shape[0]
+        deltas = np.empty(n, dtype=np.float32)
+        for i in range(n):
+            next_state = next_state_ids[i]
+            next_max = q[next_state, 0]
+            for a in range(1, n_actions):
+                if q[next_state, a] > next_max:
+                    next_max = q[next_state, a]
+            target = rewards[i] + gamma * next_max
+            deltas[i] = alpha * (target - q[state_ids[i], action_ids[i]])
+        
+        # Sequential so duplicate (s, a) pairs cannot race
+        for i in range(n):
+            q[state_ids[i], action_ids[i]] += deltas[i]
+    
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+    
+    def _mine_patterns(rewards, regions, timestamps):
+        """Scan an experience window for pattern events
+        
+        Returns start indices of three-step runs with every reward above 0.5,
+        per-region experience counts and reward sums, and indices i where the
+        step to i + 1 took 1-5 seconds and earned a reward above 0.7.
+        """
+        good = rewards > 0.5
+        sequence_starts = np.flatnonzero(good[:-2] & good[1:-1] & good[2:])
+        
+        region_counts = np.bincount(regions)
+        region_sums = np.bincount(regions, weights=rewards)
+        
+        time_diffs = np.diff(timestamps)
+        timing_hits = np.flatnonzero((time_diffs > 1.0) & (time_diffs < 5.0) & (rewards[1:] > 0.7))
+        
+        return sequence_starts, region_counts, region_sums, timing_hits
+    
+    def _q_update_batch(q, state_ids, action_ids, rewards, next_state_ids, n_actions, alpha, gamma):
+        """Apply Bellman backups r + γ·max_a' Q(s', a') to q in place
+        
+        Every delta is taken against the Q-values from before the batch, so
+        repeated (s, a) pairs accumulate exactly as with np.add.at.
+        """
+        next_max = q[next_state_ids, :n_actions].max(axis=1)
+        targets = rewards + gamma * next_max
+        np.add.at(q, (state_ids, action_ids), alpha * (targets - q[state_ids, action_ids]))
+
 class AutonomousLearningSystem:
     """Self-learning system that continuously improves while maintaining purpose"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Core learning state
-        self.is_learning = False
+        # Core learning state; _stop is set whenever the learning loop should not run
+        self._stop = threading.Event()
+        self._stop.set()
         self.learning_thread = None
         
-        # Memory systems
-        self.experience_buffer = deque(maxlen=5000)
+        # Memory systems: experiences live in a preallocated ring of parallel
+        # arrays, one slot per experience at _experience_count % capacity
+        self._rewards = np.empty(EXPERIENCE_CAPACITY, dtype=np.float32)
+        self._actions = np.empty(EXPERIENCE_CAPACITY, dtype=np.int32)  # action IDs
+        self._states = np.empty(EXPERIENCE_CAPACITY, dtype=np.int64)  # state IDs
+        self._regions = np.empty(EXPERIENCE_CAPACITY, dtype=np.int32)  # region IDs
+        self._timestamps = np.empty(EXPERIENCE_CAPACITY, dtype=np.float64)
+        self._experience_count = 0  # total experiences ever stored in the ring
+        self._analyzed_count = 0  # _experience_count at the last analysis pass
+        
+        # Only the learning thread writes the ring. The gameplay thread
+        # collects experiences in _producer_batch and hands full batches over
+        # through _handoff, keeping the last few rewards for real-time checks.
+        # The learning thread also takes batches left waiting past
+        # HANDOFF_MAX_DELAY, so _producer_batch is guarded by _batch_lock
+        self._producer_batch = []  # (reward, action_id, state_id, region_id, timestamp)
+        self._producer_batch_started = 0.0
+        self._batch_lock = threading.Lock()
+        self._handoff = queue.SimpleQueue()
+        self._recent_rewards = deque(maxlen=5)
         self.pattern_library = {}
         self.strategy_book = {}
         
@@ -39,9 +232,26 @@ class AutonomousLearningSystem:
             "macro_adaptation": {"priority": 0.7, "performance": 0.5, "target": 0.85}
         }
         
-        # Q-Learning for action optimization
-        self.q_values = defaultdict(lambda: defaultdict(float))
-        self.exploration_rate = 0.2
+        # Q-Learning for action optimization: a dense float32 table indexed by
+        # interned state and action IDs. Updates are queued and applied in
+        # vectorized batches by _flush_q_batch
+        self._state_ids: Dict[int, int] = {}
+        self._action_ids: Dict[str, int] = {}
+        self._action_names: List[str] = []  # action ID -> name
+        self._is_core_action = np.zeros(INITIAL_Q_ACTIONS, dtype=np.bool_)  # action ID -> serves a core purpose
+        self._purpose_masks: Dict[str, np.ndarray] = {}  # purpose -> action ID -> belongs to it
+        self._Q = np.full((INITIAL_Q_STATES, INITIAL_Q_ACTIONS), OPTIMISTIC_INIT, dtype=np.float32)
+        self._pending_q = []  # (state_id, action_id, reward, next_state_id)
+        self._last_transition = None  # (state_id, action_id, reward) awaiting its next state
+        self._legal_action_ids = {}  # tuple of action names -> action ID array
+        self._region_ids: Dict[str, int] = {}  # screen region name -> state hash field
+        # Gameplay contexts repeat heavily, so state digests are memoized per instance
+        self._hash_state_cached = functools.lru_cache(maxsize=4096)(self._hash_state_key)
+        self._q_lock = threading.Lock()
+        self.exploration_rate = 0.05  # low: optimistic initialization drives exploration
+        self._rng = np.random.default_rng()
+        self._uniforms = self._rng.random(RANDOM_BUFFER_SIZE).tolist()
+        self._uniform_index = 0
         self.learning_rate = 0.1
         self.discount_factor = 0.9
         
@@ -64,12 +274,17 @@ class AutonomousLearningSystem:
         
         self.logger.info("Autonomous Learning System initialized - AI will self-improve continuously")
     
+    @property
+    def is_learning(self) -> bool:
+        """Whether the autonomous learning loop is running"""
+        return not self._stop.is_set()
+    
     def start_autonomous_learning(self):
         """Start continuous autonomous learning"""
         if self.learning_thread and self.learning_thread.is_alive():
             return
         
-        self.is_learning = True
+        self._stop.clear()
         self.learning_thread = threading.Thread(target=self._autonomous_learning_loop)
         self.learning_thread.daemon = True
         self.learning_thread.start()
@@ -78,45 +293,69 @@ class AutonomousLearningSystem:
     
     def stop_autonomous_learning(self):
         """Stop autonomous learning"""
-        self.is_learning = False
+        self._stop.set()
         if self.learning_thread:
             self.learning_thread.join(timeout=3.0)
+        
+        # Keep the experiences still waiting in a partial batch. The ring is
+        # only written from here once the learning thread has really exited
+        if not (self.learning_thread and self.learning_thread.is_alive()):
+            self._hand_off_batch(force=True)
+            self._drain_experiences()
         self._save_learning_state()
         self.logger.info("Autonomous learning stopped")
     
     def _autonomous_learning_loop(self):
-        """Main autonomous learning loop"""
-        last_pattern_analysis = time.time()
-        last_knowledge_integration = time.time()
+        """Main autonomous learning loop
+        
+        Runs each learning task from a heap of (next run, order, interval,
+        task), sleeping on the stop event until the earliest one is due.
+        """
+        now = time.monotonic()
+        schedule = [
+            (now, 0, self.idle_learning_interval, self._idle_learning_tick),
+            # Periodic deep learning
+            (now + self.pattern_analysis_interval, 1, self.pattern_analysis_interval, self._deep_pattern_analysis),
+            # Repository knowledge integration
+            (now + self.knowledge_integration_interval, 2, self.knowledge_integration_interval,
+             self._integrate_repository_knowledge),
+        ]
+        heapq.heapify(schedule)
         
-        while self.is_learning:
+        while True:
+            due, order, interval, task = schedule[0]
+            if self._stop.wait(max(0.0, due - time.monotonic())):
+                break
+            
             try:
-                current_time = time.time()
-                self.idle_learning_cycles += 1
-                
-                # Continuous learning activities
-                self._unsupervised_pattern_discovery()
-                self._optimize_existing_strategies()
-                self._maintain_core_purpose_alignment()
-                
-                # Periodic deep learning
-                if current_time - last_pattern_analysis > self.pattern_analysis_interval:
-                    self._deep_pattern_analysis()
-                    last_pattern_analysis = current_time
-                
-                # Repository knowledge integration
-                if current_time - last_knowledge_integration > self.knowledge_integration_interval:
-                    self._integrate_repository_knowledge()
-                    last_knowledge_integration = current_time
-                
-                # Self-reflection to ensure purpose alignment
-                self._perform_purpose_alignment_check()
-                
-                time.sleep(self.idle_learning_interval)
-                
+                task()
             except Exception as e:
                 self.logger.error(f"Autonomous learning error: {e}")
-                time.sleep(10.0)
+                if self._stop.wait(10.0):
+                    break
+            
+            # Reschedule from the due time so intervals do not drift, without
+            # replaying runs missed while a task or error backoff overran
+            heapq.heapreplace(schedule, (max(due + interval, time.monotonic()), order, interval, task))
+    
+    def _idle_learning_tick(self):
+        """Continuous learning activities, run every idle_learning_interval"""
+        self.idle_learning_cycles += 1
+        
+        # The buffer analysis passes only run when new experiences have
+        # arrived, so an idle session does not keep rescanning (and
+        # re-storing) the same window while gameplay needs the interpreter
+        self._flush_q_batch()
+        self._drain_experiences()
+        experience_count = self._experience_count
+        if experience_count != self._analyzed_count:
+            self._analyzed_count = experience_count
+            self._unsupervised_pattern_discovery()
+            self._optimize_existing_strategies()
+            self._maintain_core_purpose_alignment()
+        
+        # Self-reflection to ensure purpose alignment
+        self._perform_purpose_alignment_check()
     
     def record_game_experience(self, action: str, context: Dict[str, Any], outcome: str, reward: float = None):
         """Record game experience for learning"""
@@ -124,60 +363,132 @@ class AutonomousLearningSystem:
         if reward is None:
             reward = self._calculate_smart_reward(action, context, outcome)
         
-        experience = {
-            'action': action,
-            'context': context,
-            'outcome': outcome,
-            'reward': reward,
-            'timestamp': time.time(),
-            'game_state_hash': self._hash_game_state(context)
-        }
-        
-        self.experience_buffer.append(experience)
-        
-        # Update Q-learning
-        self._update_q_learning(experience)
+        state_key = self._hash_game_state(context)
+        with self._q_lock:
+            state_id = self._state_id(state_key)
+            action_id = self._action_id(action)
+        
+        # Batch the experience for the learning thread
+        now = time.time()
+        experience = (reward, action_id, state_id, self._region_ids[self._canon(context)[1]], now)
+        with self._batch_lock:
+            batch = self._producer_batch
+            if not batch:
+                self._producer_batch_started = now
+            batch.append(experience)
+            if len(batch) >= HANDOFF_BATCH_SIZE or now - self._producer_batch_started >= HANDOFF_MAX_DELAY:
+                self._handoff.put(batch)
+                self._producer_batch = []
+        self._recent_rewards.append(reward)
+        
+        # Queue Q-learning update
+        self._update_q_learning(state_id, action_id, reward)
         
         # Immediate pattern detection
-        self._detect_real_time_patterns(experience)
+        self._detect_real_time_patterns(action)
         
         self.logger.debug(f"🎮 Recorded experience: {action} -> {outcome} (reward: {reward:.2f})")
     
     def choose_intelligent_action(self, available_actions: List[str], context: Dict[str, Any]) -> str:
         """Choose action using learned intelligence"""
-        state_key = self._context_to_state_key(context)
-        
         # Exploration vs exploitation with smart decay
-        if random.random() < self.exploration_rate:
-            action = random.choice(available_actions)
+        if self._next_uniform() < self.exploration_rate:
+            action = self._random_choice(available_actions)
             self.logger.debug(f"🔍 Exploring: chose {action}")
         else:
             # Choose action with highest Q-value
-            q_scores = {action: self.q_values[state_key][action] for action in available_actions}
-            action = max(q_scores, key=q_scores.get) if any(q_scores.values()) else random.choice(available_actions)
-            self.logger.debug(f"🎯 Exploiting: chose {action} (Q={q_scores.get(action, 0):.2f})")
+            self._flush_q_batch()
+            state_key = self._hash_game_state(context)
+            with self._q_lock:
+                state_id = self._state_id(state_key)
+                q_row = self._Q[state_id, self._legal_ids(available_actions)]
+            
+            best = int(q_row.argmax())
+            action = available_actions[best] if q_row.any() else self._random_choice(available_actions)
+            self.logger.debug(f"🎯 Exploiting: chose {action} (Q={q_row[best]:.2f})")
         
         # Decay exploration over time for more focused learning
         self.exploration_rate = max(0.05, self.exploration_rate * 0.9995)
         
         return action
     
+    def _next_uniform(self) -> float:
+        """Take the next pre-drawn uniform in [0, 1), refilling the buffer when it wraps"""
+        index = self._uniform_index
+        value = self._uniforms[index]
+        index = (index + 1) & (RANDOM_BUFFER_SIZE - 1)
+        if index == 0:
+            self._uniforms = self._rng.random(RANDOM_BUFFER_SIZE).tolist()
+        self._uniform_index = index
+        return value
+    
+    def _random_choice(self, options: List[str]) -> str:
+        """Pick a uniformly random option using the pre-drawn buffer"""
+        return options[int(self._next_uniform() * len(options))]
+    
+    def _hand_off_batch(self, force: bool = False):
+        """Hand the partial producer batch over if it is HANDOFF_MAX_DELAY old, or unconditionally when forced"""
+        with self._batch_lock:
+            batch = self._producer_batch
+            if batch and (force or time.time() - self._producer_batch_started >= HANDOFF_MAX_DELAY):
+                self._handoff.put(batch)
+                self._producer_batch = []
+    
+    def _drain_experiences(self):
+        """Move handed-off experience batches into the ring (learning thread only)"""
+        self._hand_off_batch()
+        experiences = []
+        while True:
+            try:
+                experiences.extend(self._handoff.get_nowait())
+            except queue.Empty:
+                break
+        if not experiences:
+            return
+        
+        # Only the newest experiences survive if a backlog exceeds the ring
+        experiences = experiences[-EXPERIENCE_CAPACITY:]
+        rewards, action_ids, state_ids, region_ids, timestamps = zip(*experiences)
+        slots = (self._experience_count + np.arange(len(experiences))) % EXPERIENCE_CAPACITY
+        self._rewards[slots] = rewards
+        self._actions[slots] = action_ids
+        self._states[slots] = state_ids
+        self._regions[slots] = region_ids
+        self._timestamps[slots] = timestamps
+        self._experience_count += len(experiences)
+    
+    def _experience_size(self) -> int:
+        """Number of experiences currently held in the ring"""
+        return min(self._experience_count, EXPERIENCE_CAPACITY)
+    
+    def _recent_slots(self, n: int) -> np.ndarray:
+        """Ring slots of the last n experiences, oldest first"""
+        end = self._experience_count
+        start = max(0, end - n, end - EXPERIENCE_CAPACITY)
+        return np.arange(start, end) % EXPERIENCE_CAPACITY
+    
     def _unsupervised_pattern_discovery(self):
         """Discover patterns without supervision"""
-        if len(self.experience_buffer) < 50:
+        if self._experience_size() < 50:
             return
         
         try:
-            recent_experiences = list(self.experience_buffer)[-100:]
+            slots = self._recent_slots(100)
+            rewards = self._rewards[slots]
+            actions = self._actions[slots]
+            timestamps = self._timestamps[slots]
+            sequence_starts, region_counts, region_sums, timing_hits = _mine_patterns(
+                rewards, self._regions[slots], timestamps
+            )
             
             # Find action sequences that lead to success
-            successful_sequences = self._find_successful_action_sequences(recent_experiences)
+            successful_sequences = self._find_successful_action_sequences(rewards, actions, sequence_starts)
             
             # Discover environmental patterns
-            environmental_patterns = self._discover_environmental_patterns(recent_experiences)
+            environmental_patterns = self._discover_environmental_patterns(region_counts, region_sums)
             
             # Learn temporal patterns
-            timing_patterns = self._learn_timing_patterns(recent_experiences)
+            timing_patterns = self._learn_timing_patterns(rewards, actions, timestamps, timing_hits)
             
             # Store discovered patterns
             new_patterns = len(successful_sequences) + len(environmental_patterns) + len(timing_patterns)
@@ -217,13 +528,9 @@ class AutonomousLearningSystem:
     
     def _maintain_core_purpose_alignment(self):
         """Ensure AI maintains its core game automation purpose"""
-        # Core purpose protection - these must always be prioritized
-        core_actions = ["open_chests", "hatch_eggs", "stay_in_breakables", "farm", "macro"]
-        
         # Check if recent actions align with core purposes
-        if len(self.experience_buffer) > 20:
-            recent_actions = [exp['action'] for exp in list(self.experience_buffer)[-20:]]
-            core_action_ratio = sum(1 for action in recent_actions if any(core in action.lower() for core in core_actions)) / len(recent_actions)
+        if self._experience_size() > 20:
+            core_action_ratio = self._is_core_action[self._actions[self._recent_slots(20)]].mean()
             
             if core_action_ratio < 0.6:  # Less than 60% core actions
                 self.logger.warning("⚠️ AI deviating from core purpose - realigning priorities")
@@ -238,14 +545,7 @@ class AutonomousLearningSystem:
             cursor = self.db_connection.cursor()
             
             # Get relevant automation patterns
-            cursor.execute("""
-                SELECT pattern_type, pattern_name, code_snippet, relevance_score
-                FROM code_patterns 
-                WHERE pattern_type IN ('computer_vision', 'input_automation', 'macro_system')
-                AND relevance_score > 0.5
-                ORDER BY relevance_score DESC
-                LIMIT 5
-            """)
+            cursor.execute("EXECUTE p_patterns(%s, %s, %s)", (RELEVANT_PATTERN_TYPES, 0.5, 5))
             
             patterns = cursor.fetchall()
             
@@ -285,7 +585,7 @@ class AutonomousLearningSystem:
             "idle_learning_cycles": self.idle_learning_cycles,
             "patterns_discovered": self.patterns_discovered,
             "autonomous_improvements": self.autonomous_improvements,
-            "experience_buffer_size": len(self.experience_buffer),
+            "experience_buffer_size": self._experience_size(),
             "core_purposes": {
                 name: {
                     "priority": data["priority"],
@@ -304,19 +604,11 @@ class AutonomousLearningSystem:
     # Helper methods for learning algorithms
     def _calculate_smart_reward(self, action: str, context: Dict[str, Any], outcome: str) -> float:
         """Calculate intelligent reward based on action, context and outcome"""
-        base_reward = 0.0
-        
         # Outcome-based rewards
-        if "success" in outcome.lower() or "completed" in outcome.lower() or "found" in outcome.lower():
-            base_reward = 1.0
-        elif "partial" in outcome.lower() or "progress" in outcome.lower():
-            base_reward = 0.5
-        elif "failed" in outcome.lower() or "error" in outcome.lower():
-            base_reward = -0.3
+        base_reward = OUTCOME_REWARDS[_classify_outcome(outcome)]
         
         # Core purpose alignment bonus
-        core_actions = ["chest", "egg", "breakable", "farm", "macro"]
-        if any(core in action.lower() for core in core_actions):
+        if _action_is_core(action):
             base_reward += 0.2  # Bonus for core actions
         
         # Efficiency bonus
@@ -329,39 +621,139 @@ class AutonomousLearningSystem:
         
         return base_reward
     
-    def _hash_game_state(self, context: Dict[str, Any]) -> str:
+    def _hash_game_state(self, context: Dict[str, Any]) -> int:
         """Create hash of game state for pattern recognition"""
-        key_elements = [
-            context.get("ui_elements_count", 0),
-            context.get("screen_region", "unknown"),
-            context.get("player_stats", {}).get("level", 0),
-            len(context.get("available_actions", []))
-        ]
-        return str(hash(tuple(key_elements)))
-    
-    def _context_to_state_key(self, context: Dict[str, Any]) -> str:
-        """Convert context to state key for Q-learning"""
-        return f"ui_{len(context.get('ui_elements', {}))}_region_{context.get('screen_region', 'unknown')}"
-    
-    def _update_q_learning(self, experience: Dict[str, Any]):
-        """Update Q-learning values"""
-        state_key = experience['game_state_hash']
-        action = experience['action']
-        reward = experience['reward']
-        
-        # Simple Q-learning update
-        current_q = self.q_values[state_key][action]
-        self.q_values[state_key][action] = current_q + self.learning_rate * (reward - current_q)
+        return self._hash_state_cached(self._canon(context))
+    
+    @staticmethod
+    def _canon(context: Dict[str, Any]) -> Tuple[int, str, int, int]:
+        """Reduce a context to the hashable fields that define its game state
+        
+        The screen region is reduced to its str() (it may be None or a
+        coordinate tuple), so region names stay valid JSON keys when saved.
+        Missing or None counts and levels become 0.
+        """
+        return (
+            int(context.get("ui_elements_count") or 0),
+            str(context.get("screen_region", "unknown")),
+            int((context.get("player_stats") or {}).get("level") or 0),
+            len(context.get("available_actions") or ())
+        )
+    
+    def _hash_state_key(self, canon: Tuple[int, str, int, int]) -> int:
+        """Digest a canonical game state
+        
+        A 64-bit blake2b digest of the packed key fields; unlike hash() it is
+        stable across runs, so saved Q-values stay keyed to the same states.
+        """
+        ui_count, region, level, n_actions = canon
+        region_id = self._region_ids.get(region)
+        if region_id is None:
+            # Under _q_lock so the learning thread never sees the dict resize mid-iteration
+            with self._q_lock:
+                region_id = self._region_ids.setdefault(region, len(self._region_ids))
+        
+        packed = struct.pack('<qQqQ', ui_count, region_id, level, n_actions)
+        return int.from_bytes(hashlib.blake2b(packed, digest_size=8).digest(), 'little')
+    
+    def _state_id(self, state_key: int) -> int:
+        """Get the Q-table row for a state key, adding one if new (hold _q_lock)"""
+        state_id = self._state_ids.get(state_key)
+        if state_id is None:
+            state_id = self._state_ids[state_key] = len(self._state_ids)
+            if state_id >= self._Q.shape[0]:
+                self._grow_q_table(state_id + 1, self._Q.shape[1])
+        return state_id
+    
+    def _action_id(self, action: str) -> int:
+        """Get the Q-table column for an action, adding one if new (hold _q_lock)"""
+        action_id = self._action_ids.get(action)
+        if action_id is None:
+            action_id = self._action_ids[action] = len(self._action_ids)
+            self._action_names.append(action)
+            if action_id >= self._Q.shape[1]:
+                self._grow_q_table(self._Q.shape[0], action_id + 1)
+            self._is_core_action[action_id] = self._names_core_action(action)
+            for purpose, mask in self._purpose_masks.items():
+                mask[action_id] = purpose.replace('_', ' ') in action.lower()
+        return action_id
+    
+    def _purpose_mask(self, purpose: str) -> np.ndarray:
+        """Get the action ID mask for a purpose, building it on first use (hold _q_lock)"""
+        mask = self._purpose_masks.get(purpose)
+        if mask is None:
+            purpose_text = purpose.replace('_', ' ')
+            mask = np.zeros(self._is_core_action.shape[0], dtype=np.bool_)
+            mask[:len(self._action_names)] = [purpose_text in action.lower() for action in self._action_names]
+            self._purpose_masks[purpose] = mask
+        return mask
+    
+    @staticmethod
+    def _names_core_action(action: str) -> bool:
+        """Whether an action name refers to one of the core purposes"""
+        action = action.lower()
+        return any(core in action for core in CORE_ACTIONS)
+    
+    def _legal_ids(self, available_actions: List[str]) -> np.ndarray:
+        """Get the Q-table columns for a list of actions (hold _q_lock)"""
+        names = tuple(available_actions)
+        ids = self._legal_action_ids.get(names)
+        if ids is None:
+            ids = np.array([self._action_id(action) for action in names], dtype=np.intp)
+            self._legal_action_ids[names] = ids
+        return ids
+    
+    def _grow_q_table(self, min_states: int, min_actions: int):
+        """Enlarge the Q-table, doubling each axis that is too small (hold _q_lock)"""
+        states, actions = self._Q.shape
+        while states < min_states:
+            states *= 2
+        while actions < min_actions:
+            actions *= 2
+        
+        grown = np.full((states, actions), OPTIMISTIC_INIT, dtype=np.float32)
+        grown[:self._Q.shape[0], :self._Q.shape[1]] = self._Q
+        self._Q = grown
+        
+        is_core = np.zeros(actions, dtype=np.bool_)
+        is_core[:self._is_core_action.shape[0]] = self._is_core_action
+        self._is_core_action = is_core
+        
+        for purpose, mask in self._purpose_masks.items():
+            self._purpose_masks[purpose] = np.zeros(actions, dtype=np.bool_)
+            self._purpose_masks[purpose][:mask.shape[0]] = mask
+    
+    def _update_q_learning(self, state_id: int, action_id: int, reward: float):
+        """Queue a Q-learning update for the previous step now that its next state is known"""
+        with self._q_lock:
+            if self._last_transition is not None:
+                self._pending_q.append(self._last_transition + (state_id,))
+            self._last_transition = (state_id, action_id, reward)
+    
+    def _flush_q_batch(self):
+        """Apply all queued Q-learning updates in one batch"""
+        with self._q_lock:
+            if not self._pending_q:
+                return
+            batch, self._pending_q = self._pending_q, []
+            
+            state_ids, action_ids, rewards, next_state_ids = zip(*batch)
+            state_ids = np.array(state_ids, dtype=np.intp)
+            action_ids = np.array(action_ids, dtype=np.intp)
+            rewards = np.array(rewards, dtype=np.float32)
+            next_state_ids = np.array(next_state_ids, dtype=np.intp)
+            
+            _q_update_batch(self._Q, state_ids, action_ids, rewards, next_state_ids,
+                            len(self._action_ids), self.learning_rate, self.discount_factor)
     
-    def _detect_real_time_patterns(self, experience: Dict[str, Any]):
+    def _detect_real_time_patterns(self, action: str):
         """Detect patterns in real-time"""
-        if len(self.experience_buffer) < 5:
+        if len(self._recent_rewards) < 5:
             return
         
         # Look for immediate action-outcome patterns
-        recent = list(self.experience_buffer)[-5:]
-        if all(exp['reward'] > 0.5 for exp in recent):
-            pattern_key = f"successful_sequence_{experience['action']}"
+        if all(reward > 0.5 for reward in self._recent_rewards):
+            pattern_key = f"successful_sequence_{action}"
             if pattern_key not in self.pattern_library:
                 self.pattern_library[pattern_key] = {
                     'type': 'action_sequence',
@@ -380,30 +772,48 @@ class AutonomousLearningSystem:
                 user=os.getenv('PGUSER'),
                 password=os.getenv('PGPASSWORD')
             )
+            # Reads only; autocommit keeps the session from idling in a transaction
+            self.db_connection.autocommit = True
+            with self.db_connection.cursor() as cursor:
+                cursor.execute(PATTERN_QUERY)
         except Exception as e:
             self.logger.error(f"Database connection failed: {e}")
     
     def _save_learning_state(self):
         """Save learning state"""
         try:
+            with self._q_lock:
+                region_ids = dict(self._region_ids)
             state = {
                 'core_purposes': self.core_purposes,
                 'patterns_discovered': self.patterns_discovered,
                 'autonomous_improvements': self.autonomous_improvements,
                 'pattern_library': self.pattern_library,
                 'strategy_book': self.strategy_book,
-                'exploration_rate': self.exploration_rate
+                'exploration_rate': self.exploration_rate,
+                'region_ids': region_ids
             }
             
             learning_dir = Path("data/autonomous_learning")
             learning_dir.mkdir(exist_ok=True)
             
-            with open(learning_dir / "learning_state.json", 'w') as f:
-                json.dump(state, f, indent=2)
+            # Serialize before touching the file, then swap it in whole, so a
+            # failed save leaves the previous state readable
+            data = _dumps_bytes(state)
+            state_file = learning_dir / "learning_state.json"
+            tmp_file = state_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, state_file)
             
-            # Save Q-values separately
-            with open(learning_dir / "q_values.json", 'w') as f:
-                json.dump(dict(self.q_values), f, indent=2)
+            # Save Q-values separately: the used block of the table as raw
+            # float32, plus the state/action keys in ID order
+            self._flush_q_batch()
+            with self._q_lock:
+                np.save(learning_dir / "q_values.npy", self._Q[:len(self._state_ids), :len(self._action_ids)])
+                q_index = {'states': list(self._state_ids), 'actions': list(self._action_ids)}
+            with open(learning_dir / "q_index.json", 'w') as f:
+                json.dump(q_index, f, indent=2)
             
         except Exception as e:
             self.logger.error(f"Failed to save learning state: {e}")
@@ -415,24 +825,35 @@ class AutonomousLearningSystem:
             
             state_file = learning_dir / "learning_state.json"
             if state_file.exists():
-                with open(state_file, 'r') as f:
-                    state = json.load(f)
+                with open(state_file, 'rb') as f:
+                    state = _loads_bytes(f.read())
                 
                 self.core_purposes = state.get('core_purposes', self.core_purposes)
                 self.patterns_discovered = state.get('patterns_discovered', 0)
                 self.autonomous_improvements = state.get('autonomous_improvements', 0)
                 self.pattern_library = state.get('pattern_library', {})
                 self.strategy_book = state.get('strategy_book', {})
-                self.exploration_rate = state.get('exploration_rate', 0.2)
+                self.exploration_rate = state.get('exploration_rate', 0.05)
+                self._region_ids = state.get('region_ids', {})
+                self._hash_state_cached.cache_clear()
             
             # Load Q-values
-            q_file = learning_dir / "q_values.json"
-            if q_file.exists():
-                with open(q_file, 'r') as f:
-                    q_data = json.load(f)
-                    for state_key, actions in q_data.items():
-                        for action, value in actions.items():
-                            self.q_values[state_key][action] = value
+            q_file = learning_dir / "q_values.npy"
+            index_file = learning_dir / "q_index.json"
+            if q_file.exists() and index_file.exists():
+                with open(index_file, 'r') as f:
+                    q_index = json.load(f)
+                q_values = np.load(q_file, mmap_mode='r')
+                with self._q_lock:
+                    self._state_ids = {state_key: i for i, state_key in enumerate(q_index['states'])}
+                    self._action_ids = {action: i for i, action in enumerate(q_index['actions'])}
+                    self._action_names = list(q_index['actions'])
+                    self._purpose_masks = {}
+                    self._grow_q_table(*q_values.shape)
+                    self._Q[:q_values.shape[0], :q_values.shape[1]] = q_values
+                    self._is_core_action[:len(self._action_names)] = [
+                        self._names_core_action(action) for action in self._action_names
+                    ]
             
             self.logger.info("Loaded previous autonomous learning state")
             
@@ -440,79 +861,69 @@ class AutonomousLearningSystem:
             self.logger.error(f"Failed to load learning state: {e}")
     
     # Simplified implementations of helper methods
-    def _find_successful_action_sequences(self, experiences: List[Dict]) -> List[Dict]:
+    def _find_successful_action_sequences(self, rewards: np.ndarray, actions: np.ndarray,
+                                          starts: np.ndarray) -> List[Dict]:
         """Find action sequences that lead to success"""
-        sequences = []
-        for i in range(len(experiences) - 2):
-            if all(exp['reward'] > 0.5 for exp in experiences[i:i+3]):
-                sequences.append({
-                    'actions': [exp['action'] for exp in experiences[i:i+3]],
-                    'effectiveness': sum(exp['reward'] for exp in experiences[i:i+3]) / 3
-                })
-        return sequences
+        return [{
+            'actions': [self._action_names[action_id] for action_id in actions[i:i+3]],
+            'effectiveness': float(rewards[i:i+3].mean(dtype=np.float64))
+        } for i in starts]
     
-    def _discover_environmental_patterns(self, experiences: List[Dict]) -> List[Dict]:
+    def _discover_environmental_patterns(self, region_counts: np.ndarray, region_sums: np.ndarray) -> List[Dict]:
         """Discover environmental patterns"""
-        patterns = []
-        context_groups = defaultdict(list)
-        
-        for exp in experiences:
-            context_key = exp['context'].get('screen_region', 'unknown')
-            context_groups[context_key].append(exp)
-        
-        for context, exps in context_groups.items():
-            if len(exps) > 3:
-                avg_reward = sum(exp['reward'] for exp in exps) / len(exps)
-                if avg_reward > 0.3:
-                    patterns.append({
-                        'context': context,
-                        'avg_effectiveness': avg_reward,
-                        'frequency': len(exps)
-                    })
+        with self._q_lock:
+            regions = list(self._region_ids.items())
+        region_names = {region_id: name for name, region_id in regions}
         
-        return patterns
-    
-    def _learn_timing_patterns(self, experiences: List[Dict]) -> List[Dict]:
-        """Learn timing patterns"""
         patterns = []
-        
-        # Simple timing analysis
-        for i in range(len(experiences) - 1):
-            time_diff = experiences[i+1]['timestamp'] - experiences[i]['timestamp']
-            if 1.0 < time_diff < 5.0 and experiences[i+1]['reward'] > 0.7:
+        for region_id in np.flatnonzero(region_counts > 3):
+            avg_reward = region_sums[region_id] / region_counts[region_id]
+            if avg_reward > 0.3:
                 patterns.append({
-                    'optimal_delay': time_diff,
-                    'action_pair': (experiences[i]['action'], experiences[i+1]['action']),
-                    'effectiveness': experiences[i+1]['reward']
+                    'context': region_names[region_id],
+                    'avg_effectiveness': float(avg_reward),
+                    'frequency': int(region_counts[region_id])
                 })
         
         return patterns
     
+    def _learn_timing_patterns(self, rewards: np.ndarray, actions: np.ndarray, timestamps: np.ndarray,
+                               hits: np.ndarray) -> List[Dict]:
+        """Learn timing patterns"""
+        return [{
+            'optimal_delay': float(timestamps[i+1] - timestamps[i]),
+            'action_pair': (self._action_names[actions[i]], self._action_names[actions[i+1]]),
+            'effectiveness': float(rewards[i+1])
+        } for i in hits]
+    
     def _store_patterns(self, pattern_groups: Dict[str, List]):
         """Store discovered patterns"""
         timestamp = time.time()
-        for pattern_type, patterns in pattern_groups.items():
-            for i, pattern in enumerate(patterns):
-                key = f"{pattern_type}_{timestamp}_{i}"
-                self.pattern_library[key] = {
-                    'type': pattern_type,
-                    'data': pattern,
-                    'discovered_at': timestamp
-                }
+        self.pattern_library.update({
+            f"{pattern_type}_{timestamp}_{i}": {
+                'type': pattern_type,
+                'data': pattern,
+                'discovered_at': timestamp
+            }
+            for pattern_type, patterns in pattern_groups.items()
+            for i, pattern in enumerate(patterns)
+        })
     
     def _measure_performance(self, purpose: str) -> float:
         """Measure current performance for a purpose"""
-        if len(self.experience_buffer) < 10:
+        if self._experience_size() < 10:
             return 0.5
         
         # Simple performance measurement based on recent experiences
-        recent_experiences = [exp for exp in list(self.experience_buffer)[-20:] 
-                            if purpose.replace('_', ' ') in exp['action'].lower()]
+        slots = self._recent_slots(20)
+        with self._q_lock:
+            mask = self._purpose_mask(purpose)
+        selected = mask[self._actions[slots]]
         
-        if not recent_experiences:
+        if not selected.any():
             return 0.5
         
-        avg_reward = sum(exp['reward'] for exp in recent_experiences) / len(recent_experiences)
+        avg_reward = float(self._rewards[slots][selected].mean())
         return max(0.0, min(1.0, (avg_reward + 1.0) / 2.0))  # Normalize to 0-1
     
     def _calculate_learning_effectiveness(self) -> float:
@@ -3,18 +3,87 @@ Autonomous Play System for AI Game Bot
 Enables fully autonomous gameplay with intelligent decision making and goal management
 """
 
+import sys
 import time
 import logging
 import threading
 import json
 import random
+import hashlib
+import heapq
+import itertools
+import re
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from pathlib import Path
-from collections import deque, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import numpy as np
 
+# Executed actions kept in decision_history (oldest are overwritten)
+HISTORY_SIZE = 1000
+HISTORY_DTYPE = np.dtype([
+    ('ts', 'f8'),
+    ('action_type', 'S24'),
+    ('success', '?'),
+    ('exec_time', 'f4'),
+    ('reward', 'f4')
+])
+
+# Slotted dataclasses need Python 3.10+; older interpreters get regular ones
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Sort keys parallel to the opportunity list built by _identify_opportunities
+OPPORTUNITY_SCORE_DTYPE = np.dtype([('prio', 'i1'), ('value', 'f4')])
+
+# Initial rows of the strategy success/failure counter; doubles when full
+INITIAL_STRATEGY_SLOTS = 256
+
+# Pre-drawn pause jitter values per refill (power of two)
+JITTER_BUFFER_SIZE = 4096
+
+# Between decision cycles the loop waits for the screen to change: the frame is
+# hashed every FRAME_POLL_INTERVAL seconds (sampling every FRAME_HASH_STRIDE-th
+# pixel), and a cycle runs anyway after MAX_IDLE_SECONDS
+FRAME_POLL_INTERVAL = 0.2
+FRAME_HASH_STRIDE = 8
+MAX_IDLE_SECONDS = 5.0
+
+# Travel speed assumed when estimating how long a multi-target action takes
+PATH_PIXELS_PER_SECOND = 500.0
+
+# Numba is optional; without it path costs fall back to NumPy
+try:
+    from numba import njit
+    
+    @njit(cache=True)
+    def _path_cost(positions):
+        """Manhattan length of the path visiting an (N, 2) position array in order"""
+        cost = 0.0
+        for i in range(1, positions.shape[0]):
+            cost += abs(positions[i, 0] - positions[i - 1, 0]) + abs(positions[i, 1] - positions[i - 1, 1])
+        return cost
+    
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+    
+    def _path_cost(positions):
+        """Manhattan length of the path visiting an (N, 2) position array in order"""
+        return float(np.abs(np.diff(positions, axis=0)).sum())
+
+def _estimate_path_time(positions: np.ndarray, per_node: float) -> float:
+    """Estimate seconds to act on every position: per_node each, plus travel between them"""
+    return len(positions) * per_node + float(_path_cost(positions)) / PATH_PIXELS_PER_SECOND
+
+def _positions_array(elems) -> np.ndarray:
+    """Copy the (x, y) of each detected element into one contiguous (N, 2) float32 array"""
+    positions = np.empty((len(elems), 2), dtype=np.float32)
+    for i, elem in enumerate(elems):
+        position = elem.position
+        positions[i, 0] = position[0]
+        positions[i, 1] = position[1]
+    return positions
+
 class PlayMode(Enum):
     IDLE = "idle"
     FARMING = "farming"
@@ -29,7 +98,14 @@ class Priority(Enum):
     HIGH = 3
     CRITICAL = 4
 
-@dataclass
+# Raw priority values; opportunity and threat dicts carry these ints as
+# 'priority_value' so decisions compare plain ints, not Enum members
+PRIORITY_LOW = Priority.LOW.value
+PRIORITY_MEDIUM = Priority.MEDIUM.value
+PRIORITY_HIGH = Priority.HIGH.value
+PRIORITY_CRITICAL = Priority.CRITICAL.value
+
+@dataclass(**DATACLASS_SLOTS)
 class AutonomousGoal:
     """Represents an autonomous gameplay goal"""
     goal_id: str
@@ -43,7 +119,7 @@ class AutonomousGoal:
     strategies: List[str]
     performance_history: List[float]
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AutonomousAction:
     """Represents an action in autonomous play"""
     action_id: str
@@ -52,7 +128,7 @@ class AutonomousAction:
     expected_outcome: str
     confidence: float
     estimated_time: float
-    dependencies: List[str]
+    dependencies: List[str] = field(default_factory=list)
     retry_count: int = 0
     max_retries: int = 3
 
@@ -69,8 +145,9 @@ class AutonomousPlaySystem:
         self.learning_system = learning_system
         self.gameplay_recorder = gameplay_recorder
         
-        # Autonomous state
-        self.is_autonomous = False
+        # Autonomous state; _stop is set whenever the play loop should not run
+        self._stop = threading.Event()
+        self._stop.set()
         self.current_mode = PlayMode.IDLE
         self.autonomous_thread = None
         
@@ -78,19 +155,35 @@ class AutonomousPlaySystem:
         self.active_goals = {}
         self.completed_goals = {}
         self.failed_goals = {}
-        self.goal_queue = deque()
+        # Heap of (-priority, seq, goal_id); entries whose goal left active_goals
+        # or was re-added under a newer seq are tombstones, dropped when popped
+        self._goal_heap: List[Tuple[int, int, str]] = []
+        self._goal_seqs: Dict[str, int] = {}
+        self._goal_counter = itertools.count()
         
-        # Decision making
-        self.decision_history = deque(maxlen=1000)
+        # Decision making: decision_history is a ring of HISTORY_DTYPE records,
+        # written at _history_count % HISTORY_SIZE
+        self.decision_history = np.zeros(HISTORY_SIZE, dtype=HISTORY_DTYPE)
+        self._history_count = 0
         self.performance_metrics = {}
-        self.strategy_effectiveness = defaultdict(lambda: {'success': 0, 'failure': 0})
+        # Strategy key -> row of _strategy_counts, whose columns are (success, failure)
+        self._strategy_ids: Dict[str, int] = {}
+        self._strategy_counts = np.zeros((INITIAL_STRATEGY_SLOTS, 2), dtype=np.int64)
         
         # Safety and monitoring
         self.safety_checks = []
         self.max_runtime = 3600  # 1 hour default
         self.start_time = 0
+        self._start_monotonic = 0.0  # runtime limits use the monotonic clock
         self.error_count = 0
         self.max_errors = 10
+        self._last_frame_digest = None  # frame hash taken by the last vision analysis
+        self._cycle_vision = None  # safety check's analysis, reused by this cycle's assessment
+        
+        # Human-like pause jitter, drawn in bulk
+        self._rng = np.random.default_rng()
+        self._jitter = self._rng.uniform(-0.2, 0.2, size=JITTER_BUFFER_SIZE).tolist()
+        self._jitter_index = 0
         
         # Adaptive behavior
         self.behavior_parameters = {
@@ -100,6 +193,16 @@ class AutonomousPlaySystem:
             'risk_tolerance': 0.4  # Willingness to try risky strategies
         }
         
+        # Action type -> (executor, pattern found in its outcome on success);
+        # a None pattern means the action always counts as successful
+        self._action_dispatch = {
+            'open_chests': (self._execute_chest_opening, re.compile('opened', re.IGNORECASE)),
+            'hatch_eggs': (self._execute_egg_hatching, re.compile('hatched', re.IGNORECASE)),
+            'farm_area': (self._execute_farming, re.compile('farming', re.IGNORECASE)),
+            'engage_minigame': (self._execute_minigame, re.compile('completed', re.IGNORECASE)),
+            'explore_area': (self._execute_exploration, None),  # Exploration is always "successful"
+        }
+        
         # Knowledge base
         self.known_strategies = {}
         self.environmental_memory = {}
@@ -108,6 +211,25 @@ class AutonomousPlaySystem:
         self._load_autonomous_knowledge()
         self.logger.info("Autonomous Play System initialized")
     
+    @property
+    def is_autonomous(self) -> bool:
+        """Whether autonomous play is running"""
+        return not self._stop.is_set()
+    
+    @property
+    def strategy_effectiveness(self) -> Dict[str, Dict[str, Any]]:
+        """Success/failure counts and success rate per strategy"""
+        counts = self._strategy_counts[:len(self._strategy_ids)]
+        rates = counts[:, 0] / np.maximum(1, counts.sum(axis=1))
+        return {
+            strategy_key: {
+                'success': int(counts[i, 0]),
+                'failure': int(counts[i, 1]),
+                'success_rate': float(rates[i])
+            }
+            for strategy_key, i in self._strategy_ids.items()
+        }
+    
     def start_autonomous_play(self, mode: PlayMode = PlayMode.FARMING, 
                             objectives: Optional[List[str]] = None,
                             max_duration: int = 3600) -> str:
@@ -116,11 +238,13 @@ class AutonomousPlaySystem:
             return "Autonomous play already active"
         
         try:
-            self.is_autonomous = True
+            self._stop.clear()
             self.current_mode = mode
             self.start_time = time.time()
+            self._start_monotonic = time.monotonic()
             self.max_runtime = max_duration
             self.error_count = 0
+            self._cycle_vision = None
             
             # Initialize goals based on mode and objectives
             self._initialize_goals(mode, objectives)
@@ -142,7 +266,7 @@ class AutonomousPlaySystem:
             return result
             
         except Exception as e:
-            self.is_autonomous = False
+            self._stop.set()
             error_msg = f"Failed to start autonomous play: {e}"
             self.logger.error(error_msg)
             return error_msg
@@ -153,7 +277,8 @@ class AutonomousPlaySystem:
             return "No autonomous play active"
         
         try:
-            self.is_autonomous = False
+            # Wakes the play loop out of any pause, so the join is prompt
+            self._stop.set()
             
             if self.autonomous_thread:
                 self.autonomous_thread.join(timeout=10.0)
@@ -161,7 +286,7 @@ class AutonomousPlaySystem:
             # Stop recording
             if self.gameplay_recorder:
                 recording_result = self.gameplay_recorder.stop_recording()
-                self.logger.info(f"Recording stopped: {recording_result}")
+                self.logger.info("Recording stopped: %s", recording_result)
             
             # Save session results
             self._save_autonomous_session()
@@ -180,7 +305,7 @@ class AutonomousPlaySystem:
     
     def _autonomous_play_loop(self):
         """Main autonomous play loop"""
-        while self.is_autonomous:
+        while not self._stop.is_set():
             try:
                 # Safety checks
                 if not self._perform_safety_checks():
@@ -188,7 +313,7 @@ class AutonomousPlaySystem:
                     break
                 
                 # Runtime limit check
-                if time.time() - self.start_time > self.max_runtime:
+                if time.monotonic() - self._start_monotonic > self.max_runtime:
                     self.logger.info("Runtime limit reached - stopping autonomous play")
                     break
                 
@@ -203,18 +328,21 @@ class AutonomousPlaySystem:
                 # Adaptive pause between cycles
                 self._adaptive_pause()
                 
+                # The last frame has been acted on; only a new one is worth analyzing
+                self._wait_for_state_change()
+                
             except Exception as e:
                 self.error_count += 1
-                self.logger.error(f"Autonomous play error: {e}")
-                time.sleep(5.0)  # Error recovery pause
+                self.logger.error("Autonomous play error: %s", e)
+                self._stop.wait(5.0)  # Error recovery pause
         
-        self.is_autonomous = False
+        self._stop.set()
     
     def _autonomous_decision_cycle(self):
         """Core decision making cycle"""
         try:
-            # 1. Assess current situation
-            game_state = self._assess_game_state()
+            # 1. Assess current situation; its timestamp is this cycle's clock
+            game_state = self._assess_game_state(time.time())
             
             # 2. Update goal progress
             self._update_goal_progress(game_state)
@@ -236,16 +364,40 @@ class AutonomousPlaySystem:
                 self._reassess_goals(game_state)
                 
         except Exception as e:
-            self.logger.error(f"Decision cycle error: {e}")
+            self.logger.error("Decision cycle error: %s", e)
             self.error_count += 1
     
-    def _assess_game_state(self) -> Dict[str, Any]:
+    def _frame_digest(self) -> Optional[bytes]:
+        """Hash of a subsampled copy of the vision system's latest screenshot"""
+        frame = getattr(self.enhanced_vision, 'last_screenshot', None)
+        if frame is None:
+            return None
+        sample = np.ascontiguousarray(frame[::FRAME_HASH_STRIDE, ::FRAME_HASH_STRIDE])
+        return hashlib.blake2b(sample.tobytes(), digest_size=8).digest()
+    
+    def _analyze_vision(self) -> Dict[str, Any]:
+        """Run the vision analysis, noting the digest of the frame it looked at"""
+        self._last_frame_digest = self._frame_digest()
+        return self.enhanced_vision.analyze_game_state()
+    
+    def _wait_for_state_change(self):
+        """Block until the screen differs from the last assessed frame, play stops, or MAX_IDLE_SECONDS pass"""
+        if self._last_frame_digest is None:
+            return  # no frame to compare against; fall back to polling every cycle
+        
+        deadline = time.monotonic() + MAX_IDLE_SECONDS
+        while self._frame_digest() == self._last_frame_digest and time.monotonic() < deadline:
+            if self._stop.wait(FRAME_POLL_INTERVAL):
+                return
+    
+    def _assess_game_state(self, now: float) -> Dict[str, Any]:
         """Comprehensive assessment of current game state"""
         game_state = {
-            'timestamp': time.time(),
-            'autonomous_session_duration': time.time() - self.start_time,
+            'timestamp': now,
+            'autonomous_session_duration': now - self.start_time,
             'detected_elements': {},
             'opportunities': [],
+            'opportunity_scores': np.empty(0, dtype=OPPORTUNITY_SCORE_DTYPE),
             'threats': [],
             'navigation_context': {},
             'resources': {},
@@ -255,19 +407,27 @@ class AutonomousPlaySystem:
         
         try:
             if self.enhanced_vision:
-                vision_analysis = self.enhanced_vision.analyze_game_state()
+                vision_analysis = self._cycle_vision
+                self._cycle_vision = None
+                if vision_analysis is None:
+                    vision_analysis = self._analyze_vision()
                 game_state.update(vision_analysis)
                 
                 # Identify opportunities
                 opportunities = self._identify_opportunities(vision_analysis)
                 game_state['opportunities'] = opportunities
+                game_state['opportunity_scores'] = np.array(
+                    [(opportunity['priority_value'], opportunity.get('estimated_value', 0))
+                     for opportunity in opportunities],
+                    dtype=OPPORTUNITY_SCORE_DTYPE
+                )
                 
                 # Identify threats or blockers
                 threats = self._identify_threats(vision_analysis)
                 game_state['threats'] = threats
         
         except Exception as e:
-            self.logger.error(f"Game state assessment failed: {e}")
+            self.logger.error("Game state assessment failed: %s", e)
         
         return game_state
     
@@ -276,36 +436,46 @@ class AutonomousPlaySystem:
         opportunities = []
         
         try:
-            detected_elements = vision_analysis.get('detected_elements', {})
+            detected_elements = vision_analysis.get('detected_elements') or {}
+            chests = detected_elements.get('chests')
+            eggs = detected_elements.get('eggs')
+            resources = detected_elements.get('resources')
+            high, medium = PRIORITY_HIGH, PRIORITY_MEDIUM
             
             # Treasure opportunities
-            if 'chests' in detected_elements and detected_elements['chests']:
+            if chests:
+                count = len(chests)
                 opportunities.append({
                     'type': 'treasure_collection',
-                    'priority': Priority.HIGH,
-                    'count': len(detected_elements['chests']),
-                    'estimated_value': len(detected_elements['chests']) * 10,
-                    'locations': [elem.position for elem in detected_elements['chests']]
+                    'priority_value': high,
+                    'count': count,
+                    'estimated_value': count * 10,
+                    'locations': [elem.position for elem in chests],
+                    'positions': _positions_array(chests)
                 })
             
             # Egg hatching opportunities
-            if 'eggs' in detected_elements and detected_elements['eggs']:
+            if eggs:
+                count = len(eggs)
                 opportunities.append({
                     'type': 'egg_hatching',
-                    'priority': Priority.MEDIUM,
-                    'count': len(detected_elements['eggs']),
-                    'estimated_value': len(detected_elements['eggs']) * 5,
-                    'locations': [elem.position for elem in detected_elements['eggs']]
+                    'priority_value': medium,
+                    'count': count,
+                    'estimated_value': count * 5,
+                    'locations': [elem.position for elem in eggs],
+                    'positions': _positions_array(eggs)
                 })
             
             # Resource gathering opportunities
-            if 'resources' in detected_elements and detected_elements['resources']:
+            if resources:
+                count = len(resources)
                 opportunities.append({
                     'type': 'resource_gathering',
-                    'priority': Priority.MEDIUM,
-                    'count': len(detected_elements['resources']),
-                    'estimated_value': len(detected_elements['resources']) * 3,
-                    'locations': [elem.position for elem in detected_elements['resources']]
+                    'priority_value': medium,
+                    'count': count,
+                    'estimated_value': count * 3,
+                    'locations': [elem.position for elem in resources],
+                    'positions': _positions_array(resources)
                 })
             
             # Farming opportunities (breakables areas)
@@ -313,7 +483,7 @@ class AutonomousPlaySystem:
             if 'breakables' in active_zones:
                 opportunities.append({
                     'type': 'farming',
-                    'priority': Priority.MEDIUM,
+                    'priority_value': medium,
                     'zone_info': active_zones['breakables'],
                     'estimated_value': 15,
                     'sustainable': True  # Can be repeated
@@ -322,17 +492,17 @@ class AutonomousPlaySystem:
             # Minigame opportunities
             minigame_status = vision_analysis.get('minigame_status', {})
             if minigame_status.get('detected', False):
-                priority = Priority.CRITICAL if 'timed' in minigame_status.get('type', '') else Priority.HIGH
+                priority = PRIORITY_CRITICAL if 'timed' in minigame_status.get('type', '') else PRIORITY_HIGH
                 opportunities.append({
                     'type': 'minigame',
-                    'priority': priority,
+                    'priority_value': priority,
                     'minigame_type': minigame_status.get('type'),
                     'time_limit': minigame_status.get('time_limit'),
                     'estimated_value': 20
                 })
         
         except Exception as e:
-            self.logger.error(f"Opportunity identification failed: {e}")
+            self.logger.error("Opportunity identification failed: %s", e)
         
         return opportunities
     
@@ -346,7 +516,7 @@ class AutonomousPlaySystem:
             if ui_state.get('error_dialog', False):
                 threats.append({
                     'type': 'ui_error',
-                    'priority': Priority.HIGH,
+                    'priority_value': PRIORITY_HIGH,
                     'description': 'Error dialog detected'
                 })
             
@@ -355,7 +525,7 @@ class AutonomousPlaySystem:
             if navigation_context.get('blocked_paths'):
                 threats.append({
                     'type': 'navigation_blocked',
-                    'priority': Priority.MEDIUM,
+                    'priority_value': PRIORITY_MEDIUM,
                     'description': 'Movement paths blocked'
                 })
             
@@ -363,12 +533,12 @@ class AutonomousPlaySystem:
             if not vision_analysis.get('detected_elements'):
                 threats.append({
                     'type': 'resource_depletion',
-                    'priority': Priority.LOW,
+                    'priority_value': PRIORITY_LOW,
                     'description': 'No immediate opportunities detected'
                 })
         
         except Exception as e:
-            self.logger.error(f"Threat identification failed: {e}")
+            self.logger.error("Threat identification failed: %s", e)
         
         return threats
     
@@ -379,30 +549,28 @@ class AutonomousPlaySystem:
             
             # 1. Handle critical threats first
             for threat in game_state.get('threats', []):
-                if threat['priority'] == Priority.CRITICAL:
+                if threat['priority_value'] == PRIORITY_CRITICAL:
                     return self._create_threat_response_action(threat)
             
-            # 2. Pursue high-value opportunities
-            opportunities = sorted(game_state.get('opportunities', []),
-                                 key=lambda x: (x['priority'].value, x.get('estimated_value', 0)),
-                                 reverse=True)
+            # 2. Pursue high-value opportunities, by priority then estimated value
+            scores = game_state['opportunity_scores']
+            order = np.lexsort((-scores['value'], -scores['prio']))
+            opportunities = [game_state['opportunities'][i] for i in order]
             
             for opportunity in opportunities:
-                if opportunity['priority'].value >= Priority.HIGH.value:
+                if opportunity['priority_value'] >= PRIORITY_HIGH:
                     action = self._create_opportunity_action(opportunity, game_state)
                     if action:
                         return action
             
             # 3. Continue with active goals
-            for goal in self.active_goals.values():
-                if goal.priority.value >= Priority.MEDIUM.value:
-                    action = self._create_goal_action(goal, game_state)
-                    if action:
-                        return action
+            action = self._next_goal_action(game_state)
+            if action:
+                return action
             
             # 4. Handle medium threats
             for threat in game_state.get('threats', []):
-                if threat['priority'] == Priority.MEDIUM:
+                if threat['priority_value'] == PRIORITY_MEDIUM:
                     return self._create_threat_response_action(threat)
             
             # 5. Pursue remaining opportunities
@@ -415,14 +583,14 @@ class AutonomousPlaySystem:
             return self._create_exploration_action(game_state)
             
         except Exception as e:
-            self.logger.error(f"Action selection failed: {e}")
+            self.logger.error("Action selection failed: %s", e)
             return None
     
     def _create_opportunity_action(self, opportunity: Dict[str, Any], 
                                  game_state: Dict[str, Any]) -> Optional[AutonomousAction]:
         """Create action to pursue an opportunity"""
         try:
-            action_id = f"opp_{opportunity['type']}_{int(time.time())}"
+            action_id = f"opp_{opportunity['type']}_{int(game_state['timestamp'])}"
             
             if opportunity['type'] == 'treasure_collection':
                 return AutonomousAction(
@@ -434,7 +602,7 @@ class AutonomousPlaySystem:
                     },
                     expected_outcome='chests_opened',
                     confidence=0.8,
-                    estimated_time=len(opportunity['locations']) * 2.0
+                    estimated_time=_estimate_path_time(opportunity['positions'], 2.0)
                 )
             
             elif opportunity['type'] == 'egg_hatching':
@@ -447,15 +615,18 @@ class AutonomousPlaySystem:
                     },
                     expected_outcome='eggs_hatched',
                     confidence=0.7,
-                    estimated_time=len(opportunity['locations']) * 1.5
+                    estimated_time=_estimate_path_time(opportunity['positions'], 1.5)
                 )
             
             elif opportunity['type'] == 'farming':
+                zone_info = opportunity['zone_info']
                 return AutonomousAction(
                     action_id=action_id,
                     action_type='farm_area',
                     parameters={
-                        'zone_info': opportunity['zone_info'],
+                        'zone_info': zone_info,
+                        # Argument for stay_in_breakables_area, built once with the action
+                        'breakables_positions': [zone_info['center']] if zone_info and 'center' in zone_info else None,
                         'duration': 30.0,  # Farm for 30 seconds
                         'strategy': 'stay_and_collect'
                     },
@@ -479,15 +650,16 @@ class AutonomousPlaySystem:
                 )
         
         except Exception as e:
-            self.logger.error(f"Opportunity action creation failed: {e}")
+            self.logger.error("Opportunity action creation failed: %s", e)
         
         return None
     
     def _execute_autonomous_action(self, action: AutonomousAction, 
                                  game_state: Dict[str, Any]) -> Dict[str, Any]:
         """Execute an autonomous action"""
+        start_time = time.perf_counter()
         try:
-            self.logger.info(f"Executing autonomous action: {action.action_type}")
+            self.logger.info("Executing autonomous action: %s", action.action_type)
             
             result = {
                 'action_id': action.action_id,
@@ -497,38 +669,17 @@ class AutonomousPlaySystem:
                 'error': None
             }
             
-            start_time = time.time()
-            
             # Execute based on action type
-            if action.action_type == 'open_chests':
-                outcome = self._execute_chest_opening(action.parameters)
-                result['success'] = 'opened' in outcome.lower()
-                result['outcome'] = outcome
-            
-            elif action.action_type == 'hatch_eggs':
-                outcome = self._execute_egg_hatching(action.parameters)
-                result['success'] = 'hatched' in outcome.lower()
-                result['outcome'] = outcome
-            
-            elif action.action_type == 'farm_area':
-                outcome = self._execute_farming(action.parameters)
-                result['success'] = 'farming' in outcome.lower()
-                result['outcome'] = outcome
-            
-            elif action.action_type == 'engage_minigame':
-                outcome = self._execute_minigame(action.parameters)
-                result['success'] = 'completed' in outcome.lower()
-                result['outcome'] = outcome
-            
-            elif action.action_type == 'explore_area':
-                outcome = self._execute_exploration(action.parameters)
-                result['success'] = True  # Exploration is always "successful"
+            handler = self._action_dispatch.get(action.action_type)
+            if handler:
+                executor, success_pattern = handler
+                outcome = executor(action.parameters)
+                result['success'] = success_pattern is None or success_pattern.search(outcome) is not None
                 result['outcome'] = outcome
-            
             else:
                 result['error'] = f"Unknown action type: {action.action_type}"
             
-            result['execution_time'] = time.time() - start_time
+            result['execution_time'] = time.perf_counter() - start_time
             
             # Record action for learning
             if self.gameplay_recorder:
@@ -542,12 +693,12 @@ class AutonomousPlaySystem:
             return result
             
         except Exception as e:
-            self.logger.error(f"Action execution failed: {e}")
+            self.logger.error("Action execution failed: %s", e)
             return {
                 'action_id': action.action_id,
                 'success': False,
                 'error': str(e),
-                'execution_time': time.time() - start_time
+                'execution_time': time.perf_counter() - start_time
             }
     
     def _execute_chest_opening(self, parameters: Dict[str, Any]) -> str:
@@ -559,7 +710,7 @@ class AutonomousPlaySystem:
             else:
                 return "No automation engine available"
         except Exception as e:
-            self.logger.error(f"Chest opening failed: {e}")
+            self.logger.error("Chest opening failed: %s", e)
             return f"Chest opening failed: {e}"
     
     def _execute_egg_hatching(self, parameters: Dict[str, Any]) -> str:
@@ -571,22 +722,26 @@ class AutonomousPlaySystem:
             else:
                 return "No automation engine available"
         except Exception as e:
-            self.logger.error(f"Egg hatching failed: {e}")
+            self.logger.error("Egg hatching failed: %s", e)
             return f"Egg hatching failed: {e}"
     
     def _execute_farming(self, parameters: Dict[str, Any]) -> str:
         """Execute farming action"""
         try:
             if self.automation_engine:
-                zone_info = parameters.get('zone_info', {})
-                if zone_info and 'center' in zone_info:
-                    return self.automation_engine.stay_in_breakables_area([zone_info['center']])
+                positions = parameters.get('breakables_positions')
+                if positions is None:
+                    zone_info = parameters.get('zone_info', {})
+                    if zone_info and 'center' in zone_info:
+                        positions = [zone_info['center']]
+                if positions:
+                    return self.automation_engine.stay_in_breakables_area(positions)
                 else:
                     return "No valid farming zone"
             else:
                 return "No automation engine available"
         except Exception as e:
-            self.logger.error(f"Farming failed: {e}")
+            self.logger.error("Farming failed: %s", e)
             return f"Farming failed: {e}"
     
     def _execute_minigame(self, parameters: Dict[str, Any]) -> str:
@@ -618,11 +773,12 @@ class AutonomousPlaySystem:
             'failed_goals': len(self.failed_goals),
             'error_count': self.error_count,
             'performance_metrics': self.performance_metrics.copy(),
+            'recent_performance': self._history_metrics(),
             'behavior_parameters': self.behavior_parameters.copy()
         }
         
         if self.is_autonomous:
-            status['runtime'] = time.time() - self.start_time
+            status['runtime'] = time.monotonic() - self._start_monotonic
             status['remaining_time'] = max(0, self.max_runtime - status['runtime'])
         
         return status
@@ -658,6 +814,8 @@ class AutonomousPlaySystem:
             performance_history=[]
         )
         self.active_goals[goal_id] = goal
+        seq = self._goal_seqs[goal_id] = next(self._goal_counter)
+        heapq.heappush(self._goal_heap, (-priority.value, seq, goal_id))
     
     def _perform_safety_checks(self) -> bool:
         """Perform safety checks"""
@@ -669,15 +827,15 @@ class AutonomousPlaySystem:
             
             # Check for game crashes or unexpected states
             if self.enhanced_vision:
-                game_state = self.enhanced_vision.analyze_game_state()
+                game_state = self._cycle_vision = self._analyze_vision()
                 if 'error' in game_state:
-                    self.logger.warning(f"Vision system error: {game_state['error']}")
+                    self.logger.warning("Vision system error: %s", game_state['error'])
                     return False
             
             return True
             
         except Exception as e:
-            self.logger.error(f"Safety check failed: {e}")
+            self.logger.error("Safety check failed: %s", e)
             return False
     
     def _adaptive_pause(self):
@@ -691,8 +849,18 @@ class AutonomousPlaySystem:
             base_pause = 2.0  # Slower for exploration
         
         # Add some randomness for human-like behavior
-        pause_time = base_pause + random.uniform(-0.2, 0.2)
-        time.sleep(max(0.1, pause_time))
+        pause_time = base_pause + self._next_jitter()
+        self._stop.wait(max(0.1, pause_time))
+    
+    def _next_jitter(self) -> float:
+        """Take the next pre-drawn pause jitter value, refilling the buffer when it wraps"""
+        index = self._jitter_index
+        value = self._jitter[index]
+        index = (index + 1) & (JITTER_BUFFER_SIZE - 1)
+        if index == 0:
+            self._jitter = self._rng.uniform(-0.2, 0.2, size=JITTER_BUFFER_SIZE).tolist()
+        self._jitter_index = index
+        return value
     
     def _update_goal_progress(self, game_state: Dict[str, Any]):
         """Update progress on active goals"""
@@ -704,15 +872,45 @@ class AutonomousPlaySystem:
         # Placeholder implementation
         pass
     
+    def _push_history(self, ts: float, action_type: str, success: bool, exec_time: float, reward: float):
+        """Record an executed action in the decision history ring"""
+        record = self.decision_history[self._history_count % HISTORY_SIZE]
+        record['ts'] = ts
+        record['action_type'] = action_type.encode()[:24]
+        record['success'] = success
+        record['exec_time'] = exec_time
+        record['reward'] = reward
+        self._history_count += 1
+    
+    def _history_metrics(self) -> Dict[str, Any]:
+        """Summarize the actions held in the decision history"""
+        history = self.decision_history[:min(self._history_count, HISTORY_SIZE)]
+        if not len(history):
+            return {'actions': 0}
+        return {
+            'actions': len(history),
+            'success_rate': float(history['success'].mean()),
+            'mean_reward': float(history['reward'].mean()),
+            'mean_execution_time': float(history['exec_time'].mean())
+        }
+    
     def _learn_from_action_result(self, action: AutonomousAction, 
                                 result: Dict[str, Any], game_state: Dict[str, Any]):
         """Learn from action execution results"""
+        success = result.get('success', False)
+        self._push_history(game_state['timestamp'], action.action_type, success,
+                           result.get('execution_time', 0.0), 10.0 if success else -1.0)
+        
         # Update strategy effectiveness
         strategy_key = f"{action.action_type}_{action.parameters.get('strategy', 'default')}"
-        if result.get('success', False):
-            self.strategy_effectiveness[strategy_key]['success'] += 1
-        else:
-            self.strategy_effectiveness[strategy_key]['failure'] += 1
+        strategy_id = self._strategy_ids.get(strategy_key)
+        if strategy_id is None:
+            strategy_id = self._strategy_ids[strategy_key] = len(self._strategy_ids)
+            if strategy_id >= len(self._strategy_counts):
+                grown = np.zeros((len(self._strategy_counts) * 2, 2), dtype=np.int64)
+                grown[:strategy_id] = self._strategy_counts
+                self._strategy_counts = grown
+        self._strategy_counts[strategy_id, 0 if success else 1] += 1
     
     def _adapt_behavior(self, result: Dict[str, Any]):
         """Adapt behavior based on recent results"""
@@ -731,6 +929,26 @@ class AutonomousPlaySystem:
         # Placeholder implementation
         return None
     
+    def _next_goal_action(self, game_state: Dict[str, Any]) -> Optional[AutonomousAction]:
+        """Action for the highest-priority active goal (MEDIUM or above) that yields one"""
+        heap = self._goal_heap
+        live = []
+        action = None
+        try:
+            while heap and -heap[0][0] >= PRIORITY_MEDIUM:
+                entry = heapq.heappop(heap)
+                goal_id = entry[2]
+                if goal_id not in self.active_goals or self._goal_seqs.get(goal_id) != entry[1]:
+                    continue  # tombstone
+                live.append(entry)
+                action = self._create_goal_action(self.active_goals[goal_id], game_state)
+                if action:
+                    break
+        finally:
+            for entry in live:
+                heapq.heappush(heap, entry)
+        return action
+    
     def _create_goal_action(self, goal: AutonomousGoal, 
                           game_state: Dict[str, Any]) -> Optional[AutonomousAction]:
         """Create action to pursue a goal"""
@@ -740,7 +958,7 @@ class AutonomousPlaySystem:
     def _create_exploration_action(self, game_state: Dict[str, Any]) -> Optional[AutonomousAction]:
         """Create exploration action"""
         return AutonomousAction(
-            action_id=f"explore_{int(time.time())}",
+            action_id=f"explore_{int(game_state['timestamp'])}",
             action_type='explore_area',
             parameters={
                 'target_position': (random.randint(100, 700), random.randint(100, 500)),
@@ -762,7 +980,7 @@ class AutonomousPlaySystem:
                 'failed_goals': len(self.failed_goals),
                 'error_count': self.error_count,
                 'performance_metrics': self.performance_metrics,
-                'strategy_effectiveness': dict(self.strategy_effectiveness)
+                'strategy_effectiveness': self.strategy_effectiveness
             }
             
             sessions_dir = Path("data/autonomous_sessions")
@@ -775,7 +993,7 @@ class AutonomousPlaySystem:
             self.logger.info("Autonomous session data saved")
             
         except Exception as e:
-            self.logger.error(f"Failed to save session data: {e}")
+            self.logger.error("Failed to save session data: %s", e)
     
     def _load_autonomous_knowledge(self):
         """Load autonomous knowledge from previous sessions"""
@@ -791,4 +1009,4 @@ class AutonomousPlaySystem:
                 
                 self.logger.info("Autonomous knowledge loaded")
         except Exception as e:
-            self.logger.error(f"Failed to load autonomous knowledge: {e}")
\ No newline at end of file
+            self.logger.error("Failed to load autonomous knowledge: %s", e)
\ No newline at end of file
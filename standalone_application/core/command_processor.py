@@ -571,10 +571,10 @@ class CommandProcessor:
             status += f"Vision System: {'Active' if self.vision.is_active() else 'Inactive'}\n"
             
             # Automation system status
-            status += f"Automation Engine: {'Active' if self.automation.is_active() else 'Inactive'}\n"
-            if self.automation.is_active():
-                queue_size = self.automation.get_queue_size()
-                status += f"  - Action queue: {queue_size} pending\n"
+            automation_active = self.automation.is_active()
+            status += f"Automation Engine: {'Active' if automation_active else 'Inactive'}\n"
+            if automation_active:
+                status += f"  - Action queue: {self.automation.get_queue_size()} pending\n"
             
             # Learning system stats
             learning_stats = self.learning.get_stats()
@@ -13,7 +13,6 @@ from typing import Dict, List, Any, Optional, Tuple, Set
 from pathlib import Path
 from collections import defaultdict, deque
 from dataclasses import dataclass
-import pickle
 
 try:
     import pyautogui
@@ -12,7 +12,6 @@ from typing import Dict, List, Any, Optional, Tuple, Callable
 from pathlib import Path
 from collections import deque, defaultdict
 from dataclasses import dataclass, asdict
-import pickle
 import cv2
 
 try:
@@ -14,6 +14,12 @@ from pathlib import Path
 from dataclasses import dataclass, asdict
 from collections import deque
 
+# pybase64 uses SIMD kernels; fall back to the stdlib encoder when missing
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 # Handle PyAutoGUI import for headless environments
 try:
     import pyautogui
@@ -198,11 +204,10 @@ class InteractiveTrainer:
             item_id = f"item_{int(time.time())}_{mouse_x}_{mouse_y}"
             
             # Save screenshot as base64
-            import base64
             from io import BytesIO
             buffer = BytesIO()
             screenshot.save(buffer, format='PNG')
-            screenshot_b64 = base64.b64encode(buffer.getvalue()).decode()
+            screenshot_b64 = base64.b64encode(buffer.getvalue()).decode('ascii')
             
             # Create interactive item
             interactive_item = InteractiveItem(
@@ -423,7 +428,6 @@ class InteractiveTrainer:
             
             for item_id, learned_item in self.learned_items.items():
                 # Decode the stored screenshot
-                import base64
                 from PIL import Image
                 from io import BytesIO
                 
@@ -489,6 +493,13 @@ class InteractiveTrainer:
             self.logger.error(error_msg)
             return error_msg
     
+    def iter_training_data(self):
+        """Yield (section, key, record) for each learned item and zone, one at a time"""
+        for item_id, item in list(self.learned_items.items()):
+            yield 'learned_items', item_id, asdict(item)
+        for zone_id, zone in list(self.game_zones.items()):
+            yield 'game_zones', zone_id, asdict(zone)
+    
     def export_training_data(self) -> Dict[str, Any]:
         """Export all training data for backup or sharing"""
         return {
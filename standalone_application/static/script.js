@@ -201,7 +201,8 @@ class GameBotDashboard {
     
     displayCommandResult(result) {
         const resultsDiv = document.getElementById('commandResults');
-        const timestamp = new Date(result.timestamp).toLocaleTimeString();
+        // Server timestamps are epoch seconds
+        const timestamp = new Date(result.timestamp * 1000).toLocaleTimeString();
         
         const resultHTML = `
             <div class="mb-2">
@@ -243,7 +244,7 @@ class GameBotDashboard {
             
             if (response.ok) {
                 this.updateStatusDisplay(status);
-                this.updateScreenCapture(status.screen_capture);
+                this.updateScreenCapture(status.screen_url);
             } else {
                 console.error('Failed to fetch status:', status.error);
                 this.updateConnectionStatus(false);
@@ -256,7 +257,7 @@ class GameBotDashboard {
     
     updateStatusDisplay(status) {
         // Update timestamp
-        const timestamp = new Date(status.timestamp).toLocaleTimeString();
+        const timestamp = new Date(status.timestamp * 1000).toLocaleTimeString();
         document.getElementById('timestamp').textContent = timestamp;
         
         // Update system status badges
@@ -286,14 +287,44 @@ class GameBotDashboard {
         this.updateConnectionStatus(true);
     }
     
-    updateScreenCapture(screenB64) {
+    updateScreenCapture(screenUrl) {
         const screenImg = document.getElementById('screenCapture');
         const noCapture = document.getElementById('noCapture');
         
-        if (screenB64) {
-            screenImg.src = `data:image/jpeg;base64,${screenB64}`;
-            screenImg.style.display = 'block';
-            noCapture.style.display = 'none';
+        // The MJPEG stream keeps the image live on its own once connected
+        if (this.streamActive) {
+            return;
+        }
+        
+        if (this.streamActive === undefined) {
+            this.streamActive = true;
+            screenImg.onload = () => {
+                screenImg.style.display = 'block';
+                noCapture.style.display = 'none';
+            };
+            screenImg.onerror = () => {
+                // Fall back to polling single frames from /api/screen.jpg
+                this.streamActive = false;
+                screenImg.onload = null;
+                screenImg.onerror = null;
+            };
+            screenImg.src = '/api/stream.mjpeg';
+            return;
+        }
+        
+        if (screenUrl) {
+            // Swap in the new frame only once it has loaded to avoid flicker
+            const nextFrame = new Image();
+            nextFrame.onload = () => {
+                screenImg.src = nextFrame.src;
+                screenImg.style.display = 'block';
+                noCapture.style.display = 'none';
+            };
+            nextFrame.onerror = () => {
+                screenImg.style.display = 'none';
+                noCapture.style.display = 'flex';
+            };
+            nextFrame.src = screenUrl;
         } else {
             screenImg.style.display = 'none';
             noCapture.style.display = 'flex';